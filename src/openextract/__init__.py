@@ -12,37 +12,72 @@ Example usage:
     >>> results.to_csv("output.csv", index=False)
 
 For use in Google Colab:
-    !pip install pdfplumber pandas
+    !pip install pdfplumber pandas pymupdf  # pymupdf is optional (faster text extraction)
     !git clone https://github.com/YOUR_USERNAME/openextract.git
     import sys
     sys.path.insert(0, 'openextract/src')
     from openextract import Extractor
+
+Public names are imported lazily on first access, so importing only the
+utility helpers (e.g. ``parse_currency``) does not pull in pdfplumber/pandas.
 """
 
-from .extractor import Extractor
-from .template_loader import TemplateLoader
-from .utils import (
-    parse_currency,
-    parse_integer,
-    parse_percentage,
-    parse_date,
-    format_date,
-    clean_text,
-    normalize_ein,
-    normalize_ssn,
-)
+import importlib
+from types import MappingProxyType
 
 __version__ = '1.0.0'
 __author__ = 'OpenExtract Community'
-__all__ = [
+__all__ = (
     'Extractor',
     'TemplateLoader',
+    'DEFAULT_BACKEND',
+    'HAS_PDFTOTEXT',
     'parse_currency',
     'parse_integer',
     'parse_percentage',
+    'parse_currency_series',
+    'parse_integer_series',
+    'parse_percentage_series',
+    'coerce_series',
     'parse_date',
     'format_date',
     'clean_text',
     'normalize_ein',
     'normalize_ssn',
-]
+)
+
+# Public name -> (submodule, attribute), resolved on first access (PEP 562)
+_LAZY = MappingProxyType({
+    'Extractor': ('.extractor', 'Extractor'),
+    'TemplateLoader': ('.template_loader', 'TemplateLoader'),
+    'DEFAULT_BACKEND': ('.extractor', 'DEFAULT_BACKEND'),
+    'HAS_PDFTOTEXT': ('.extractor', 'HAS_PDFTOTEXT'),
+    'parse_currency': ('.utils', 'parse_currency'),
+    'parse_integer': ('.utils', 'parse_integer'),
+    'parse_percentage': ('.utils', 'parse_percentage'),
+    'parse_currency_series': ('.utils', 'parse_currency_series'),
+    'parse_integer_series': ('.utils', 'parse_integer_series'),
+    'parse_percentage_series': ('.utils', 'parse_percentage_series'),
+    'coerce_series': ('.utils', 'coerce_series'),
+    'parse_date': ('.utils', 'parse_date'),
+    'format_date': ('.utils', 'format_date'),
+    'clean_text': ('.utils', 'clean_text'),
+    'normalize_ein': ('.utils', 'normalize_ein'),
+    'normalize_ssn': ('.utils', 'normalize_ssn'),
+})
+
+
+def __getattr__(name):
+    target = _LAZY.get(name)
+    if target is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module_name, attr = target
+    value = getattr(importlib.import_module(module_name, __name__), attr)
+    # Cache on the module so later lookups skip __getattr__ entirely
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
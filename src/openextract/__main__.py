@@ -0,0 +1,149 @@
+"""
+Command-line interface for OpenExtract.
+
+Example usage:
+    python -m openextract statements/*.pdf -t form-5500 -o out/ -j 4
+
+PDFs are parsed in a pool of worker processes while a writer thread saves
+each finished result as CSV, so disk writes overlap with parsing.
+"""
+
+import argparse
+import os
+import queue
+import sys
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from itertools import islice
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .extractor import BACKENDS, DEFAULT_BACKEND, _extract_worker
+
+# Sentinel telling the writer thread that no more results are coming
+_DONE = None
+
+
+def _write_results(results: queue.Queue, written: List[Path]) -> None:
+    """Writer thread: save each (csv_path, DataFrame) from the queue."""
+    while True:
+        item = results.get()
+        if item is _DONE:
+            return
+        csv_path, df = item
+        try:
+            df.to_csv(csv_path, index=False)
+        except OSError as e:
+            # Keep draining the queue so the parsing side never blocks on put()
+            print(f"Error writing {csv_path}: {e}", file=sys.stderr)
+            continue
+        written.append(csv_path)
+
+
+def _output_paths(pdf_paths: List[str], output_dir: Path) -> List[Path]:
+    """
+    Pick a CSV path in output_dir for each input PDF.
+
+    Each CSV is named after its PDF. When two inputs share a name (a/x.pdf
+    and b/x.pdf), the later one gets a numbered name (x-2.csv) and a warning
+    is printed, so no result overwrites another.
+
+    Args:
+        pdf_paths: Input PDF paths, in command-line order
+        output_dir: Directory the CSV files are written to
+
+    Returns:
+        The CSV path for each input, in the same order
+    """
+    outputs: List[Path] = []
+    taken: Dict[str, str] = {}
+    for pdf_path in pdf_paths:
+        stem = Path(pdf_path).stem
+        name = f"{stem}.csv"
+        n = 1
+        while name in taken:
+            n += 1
+            name = f"{stem}-{n}.csv"
+        if n > 1:
+            print(
+                f"Warning: {pdf_path} has the same name as {taken[f'{stem}.csv']}; "
+                f"writing it to {name}",
+                file=sys.stderr,
+            )
+        taken[name] = pdf_path
+        outputs.append(output_dir / name)
+    return outputs
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run batch extraction from the command line.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:])
+
+    Returns:
+        Process exit code (0 if every PDF was extracted, 1 otherwise)
+    """
+    parser = argparse.ArgumentParser(
+        prog='python -m openextract',
+        description='Extract structured data from PDFs into CSV files.',
+    )
+    parser.add_argument('paths', nargs='+', help='PDF files to extract')
+    parser.add_argument('-t', '--template', required=True, help='Template ID (e.g. form-5500)')
+    parser.add_argument('-o', '--output-dir', default='.', help='Directory for CSV output')
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help='Number of parsing processes (default: CPU count)')
+    parser.add_argument('--templates-dir', default=None, help='Custom templates directory')
+    parser.add_argument('--backend', choices=BACKENDS, default=DEFAULT_BACKEND,
+                        help=f'PDF text backend (default: {DEFAULT_BACKEND})')
+    args = parser.parse_args(argv)
+
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    jobs = args.jobs or os.cpu_count() or 1
+
+    inputs = iter(zip(args.paths, _output_paths(args.paths, output_dir)))
+
+    # Parsed results wait in at most `window` futures plus the bounded queue,
+    # so memory stays flat however many PDFs are in the batch
+    window = 2 * jobs
+    results: queue.Queue = queue.Queue(maxsize=window)
+    written: List[Path] = []
+    writer = threading.Thread(target=_write_results, args=(results, written))
+    writer.start()
+
+    failures = 0
+    try:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            pending: Dict[Future, Tuple[str, Path]] = {}
+
+            def submit(count: int) -> None:
+                """Start up to count more PDFs."""
+                for pdf_path, csv_path in islice(inputs, count):
+                    future = executor.submit(
+                        _extract_worker, pdf_path, args.template, args.templates_dir, args.backend
+                    )
+                    pending[future] = (pdf_path, csv_path)
+
+            submit(window)
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    pdf_path, csv_path = pending.pop(future)
+                    try:
+                        results.put((csv_path, future.result()))
+                    except Exception as e:
+                        failures += 1
+                        print(f"Error processing {pdf_path}: {e}", file=sys.stderr)
+                submit(len(done))
+    finally:
+        results.put(_DONE)
+        writer.join()
+
+    print(f"Wrote {len(written)} CSV file(s) to {output_dir}")
+    return 1 if failures or len(written) < len(args.paths) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
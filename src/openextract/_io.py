@@ -0,0 +1,101 @@
+"""
+Low-level file access helpers for OpenExtract.
+"""
+
+import hashlib
+import io
+import mmap
+import os
+import tempfile
+from pathlib import Path
+from typing import BinaryIO, Optional, Union
+
+# Read size used when hashing files for cache keys
+_HASH_CHUNK_SIZE = 1 << 20
+
+
+def _open_pdf_bytes(pdf_path: Union[str, Path]) -> BinaryIO:
+    """
+    Open a PDF as a read-only memory map for pdfminer-based parsers.
+
+    pdfminer seeks and reads the file in many small pieces; serving those
+    from a memory map avoids a read() syscall per piece. Where supported,
+    the kernel is also told the file will be read sequentially so it can
+    read ahead aggressively.
+
+    Args:
+        pdf_path: Path to the PDF file
+
+    Returns:
+        Seekable binary stream (mmap, or an empty BytesIO for empty files).
+        Use it as a context manager so the mapping is released.
+    """
+    fd = os.open(pdf_path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    try:
+        if os.fstat(fd).st_size == 0:
+            # mmap cannot map empty files; let the parser report the bad PDF
+            return io.BytesIO()
+
+        if hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+        mapped = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+        if hasattr(mapped, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+            mapped.madvise(mmap.MADV_SEQUENTIAL)
+        return mapped
+    finally:
+        # The mapping holds its own reference to the file
+        os.close(fd)
+
+
+def _file_digest(path: Union[str, Path]) -> str:
+    """BLAKE2b hex digest of a file's contents (used as a cache key)."""
+    digest = hashlib.blake2b(digest_size=20)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _cache_dir(kind: str) -> Path:
+    """
+    Per-user cache directory for OpenExtract.
+
+    Uses $OPENEXTRACT_CACHE_DIR when set, otherwise $XDG_CACHE_HOME/openextract
+    (default ~/.cache/openextract).
+    """
+    base = os.environ.get('OPENEXTRACT_CACHE_DIR')
+    if not base:
+        xdg = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+        base = os.path.join(xdg, 'openextract')
+    return Path(base) / kind
+
+
+def _read_cached_text(path: Path) -> Optional[str]:
+    """Return a cached text file's contents, or None on a miss."""
+    try:
+        return path.read_text(encoding='utf-8')
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def _write_cached_text(path: Path, text: str) -> None:
+    """
+    Atomically write a cache entry; failures are ignored.
+
+    The text goes to a temp file in the same directory and is renamed into
+    place, so concurrent readers never see a partial entry.
+    """
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(text)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError:
+        # A read-only or full cache directory only costs a re-OCR next time
+        pass
@@ -2,13 +2,42 @@
 Core PDF extraction functionality for OpenExtract.
 """
 
+import codecs
+import hashlib
+import os
 import re
+import shutil
+import subprocess
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Union
+from typing import Callable, Dict, List, Optional, Any, Tuple, Union
 
 import pandas as pd
 import pdfplumber
 
+from ._io import (
+    _cache_dir,
+    _file_digest,
+    _open_pdf_bytes,
+    _read_cached_text,
+    _write_cached_text,
+)
+from .template_loader import (
+    TemplateLoader,
+    compile_field_patterns,
+    compile_keyword_patterns,
+    date_field_names,
+    keyword_needles,
+    required_fields,
+)
+from .utils import (
+    get_coercer,
+    clean_text,
+    format_date,
+)
+
 # OCR support (optional)
 try:
     from pdf2image import convert_from_path
@@ -17,15 +46,433 @@ try:
 except ImportError:
     OCR_AVAILABLE = False
 
-from .template_loader import TemplateLoader
-from .utils import (
-    coerce_value,
-    clean_text,
-    extract_first_match,
-    format_date,
+# PyMuPDF text backend (optional, much faster than pdfplumber)
+try:
+    import pymupdf
+    PYMUPDF_AVAILABLE = True
+except ImportError:
+    PYMUPDF_AVAILABLE = False
+
+# pypdfium2 text backend (optional, PDFium C++ engine; pdfplumber depends on it)
+try:
+    import pypdfium2
+    PDFIUM_AVAILABLE = True
+except ImportError:
+    PDFIUM_AVAILABLE = False
+
+# Hyperscan multi-pattern engine (optional, one pass for the DOL patterns)
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+# Default OCR settings for DOL forms: 200 DPI and Tesseract's own defaults.
+# Both can be overridden per Extractor (ocr_dpi, ocr_config).
+OCR_DPI = 200
+OCR_CONFIG = ''
+
+# PDFs whose extracted text each Extractor keeps in memory, so extracting
+# the same unchanged file again (another template, other pages) skips parsing
+_TEXT_CACHE_SIZE = 16
+
+# poppler's pdftotext binary (optional, native text extraction)
+HAS_PDFTOTEXT = shutil.which('pdftotext') is not None
+
+# Default text backend. The template patterns are written against
+# pdfplumber's text layout; the other backends are faster but lay text out
+# differently and can change extracted values, so they are opt-in. When a
+# requested backend is not installed the next available one in BACKENDS is
+# used, ending with pdfplumber (always installed).
+DEFAULT_BACKEND = 'pdfplumber'
+BACKENDS = ('pymupdf', 'pdfium', 'pdftotext', 'pdfplumber')
+_BACKEND_AVAILABLE = {
+    'pymupdf': PYMUPDF_AVAILABLE,
+    'pdfium': PDFIUM_AVAILABLE,
+    'pdftotext': HAS_PDFTOTEXT,
+    'pdfplumber': True,
+}
+
+
+# ============== DOL FORM 5500 PATTERNS ==============
+# Compiled once at import; used by Extractor._extract_dol_form_data.
+# Without Hyperscan these stay as separate searches on purpose: each one starts
+# with a literal that the re module can skip ahead to, whereas a combined
+# alternation has to try every branch at every offset and measured 5-10x
+# slower on real filings.
+
+_RE_PLAN_YEAR = re.compile(r'beginning\s+(\d{2}/\d{2}/\d{4})\s+and\s+ending\s+(\d{2}/\d{2}/\d{4})')
+_RE_PLAN_NAME = re.compile(r'Name of plan.*?\n\s*(.+?)\s*\(PN\)', re.IGNORECASE | re.DOTALL)
+_RE_PLAN_NAME_LABEL = re.compile(r'Name of plan', re.IGNORECASE)
+_RE_PN_MARKER = re.compile(r'\(PN\)', re.IGNORECASE)
+_RE_PLAN_NUMBER = re.compile(r'\(PN\)[^\d]*(\d{3})')
+_RE_EFFECTIVE_DATE = re.compile(r'Effective date[^\d]*(\d{2}/\d{2}/\d{4})', re.IGNORECASE)
+_RE_EIN = re.compile(r'(?:EIN|Identification Number)[^\d]*(\d{2})-?(\d{7})')
+_RE_SPONSOR_PHONE = re.compile(r"Sponsor's telephone[^\d]*(\d{3})-(\d{3})-(\d{4})", re.IGNORECASE)
+_RE_BUSINESS_CODE = re.compile(r'(?:Business code|2d)[^\d]*(\d{6})', re.IGNORECASE)
+_RE_LOCATION = re.compile(r'([A-Z][A-Z\s]+),\s*([A-Z]{2})\s+(\d{5})')
+
+_RE_LINE_5A = re.compile(r'5a\s+(\d+)')
+_RE_LINE_5B = re.compile(r'5b\s+(\d+)')
+_RE_LINE_5C1 = re.compile(r'5c[e\(]?1[)\s]+(\d+)', re.IGNORECASE)
+_RE_LINE_5C2 = re.compile(r'5c[e\(]?2[)\s]+(\d+)', re.IGNORECASE)
+
+_RE_LINE_7A = re.compile(r'7a\s+\$?([\d,]+)\s+\$?([\d,]+)')
+_RE_LINE_7B = re.compile(r'7b\s+\$?([\d,]+)\s+\$?([\d,]+)')
+_RE_LINE_7C = re.compile(r'7c\s+\$?([\d,]+)\s+\$?([\d,]+)')
+
+# All of line 8 in one scan. Only the leading "8" is consumed, so every
+# occurrence of every code is still seen (same result as one search per code).
+_RE_LINE_8 = re.compile(r'8(?=(a\([123]\)|[b-j])\s+\$?([\d,]+))')
+_LINE_8_FIELDS = {
+    'a(1)': 'employer_contributions',
+    'a(2)': 'participant_contributions',
+    'a(3)': 'other_contributions',
+    'b': 'other_income',
+    'c': 'total_contributions',
+    'd': 'benefit_payments',
+    'e': 'deemed_distributions',
+    'f': 'admin_expenses',
+    'g': 'other_expenses',
+    'h': 'total_expenses',
+    'i': 'net_income',
+    'j': 'transfers',
+}
+
+_RE_FEATURE_CODES = re.compile(r'\b([23][A-Z])\b')
+_MAX_FEATURE_CODES = 10
+_RE_FIDELITY_BOND = re.compile(r'(?:10c|fidelity bond)[^\d]*\$?([\d,]+)', re.IGNORECASE)
+
+_RE_SCHED_H_ASSETS = re.compile(
+    r'Total assets[^\d]*(\d{1,3}(?:,?\d{3})*)\s+(\d{1,3}(?:,?\d{3})*)', re.IGNORECASE
+)
+_RE_SCHED_H_LIABILITIES = re.compile(
+    r'Total liabilities[^\d]*(\d{1,3}(?:,?\d{3})*)\s+(\d{1,3}(?:,?\d{3})*)', re.IGNORECASE
+)
+_RE_SCHED_H_NET_ASSETS = re.compile(
+    r'Net assets[^\d]*(\d{1,3}(?:,?\d{3})*)\s+(\d{1,3}(?:,?\d{3})*)', re.IGNORECASE
+)
+_RE_SCHED_H_EMPLOYER = re.compile(
+    r'Employer contributions\s+(\d{1,3}(?:,?\d{3})*)\s+(\d{1,3}(?:,?\d{3})*)', re.IGNORECASE
+)
+_RE_SCHED_H_PARTICIPANT = re.compile(
+    r'Participant contributions\s+(\d{1,3}(?:,?\d{3})*)\s+(\d{1,3}(?:,?\d{3})*)', re.IGNORECASE
+)
+_RE_PARTICIPANTS_BOY = re.compile(r'beginning of the plan year\s+5\s+(\d+)', re.IGNORECASE)
+_RE_PARTICIPANTS_EOY = re.compile(r'end of the plan year\s+6\s+(\d+)', re.IGNORECASE)
+_RE_PARTICIPANTS_ALT = re.compile(
+    r'participants.*?beginning.*?(\d+).*?end.*?(\d+)', re.IGNORECASE | re.DOTALL
+)
+_RE_SPONSOR_NAME = re.compile(
+    r"Plan sponsor's name.*?\n([A-Z0-9][A-Z0-9\s,\.]+(?:LLC|INC|CORP|LLP|LP)?)", re.IGNORECASE
 )
 
 
+# First-hit DOL patterns that Hyperscan locates together in one pass over the
+# text. Each hit is confirmed with re.match at the reported start, so groups
+# are exactly what re.search returns. The DOTALL patterns stay on re: their
+# lazy .*? makes Hyperscan report thousands of overlapping matches.
+# None of these may use \w or \b (see _hyperscan_text).
+_DOL_SCAN_PATTERNS = (
+    _RE_PLAN_YEAR, _RE_PLAN_NUMBER, _RE_EFFECTIVE_DATE, _RE_EIN,
+    _RE_SPONSOR_PHONE, _RE_BUSINESS_CODE, _RE_LOCATION,
+    _RE_LINE_5A, _RE_LINE_5B, _RE_LINE_5C1, _RE_LINE_5C2,
+    _RE_LINE_7A, _RE_LINE_7B, _RE_LINE_7C, _RE_FIDELITY_BOND,
+    _RE_SCHED_H_ASSETS, _RE_SCHED_H_LIABILITIES, _RE_SCHED_H_NET_ASSETS,
+    _RE_SCHED_H_EMPLOYER, _RE_SCHED_H_PARTICIPANT,
+    _RE_PARTICIPANTS_BOY, _RE_PARTICIPANTS_EOY, _RE_SPONSOR_NAME,
+)
+_DOL_SCAN_IDS = {pattern: i for i, pattern in enumerate(_DOL_SCAN_PATTERNS)}
+
+# Case-insensitive patterns that only capture digits, recompiled without
+# IGNORECASE to run on the lowercased text. re can then jump straight to
+# their literal prefix, which is 5-10x faster, and lowercasing never changes
+# the digits they capture. (None of them use uppercase escapes like \D.)
+_DOL_LOWERED = {
+    pattern: re.compile(pattern.pattern.lower(), pattern.flags & ~re.IGNORECASE)
+    for pattern in (
+        _RE_EFFECTIVE_DATE, _RE_SPONSOR_PHONE, _RE_BUSINESS_CODE, _RE_FIDELITY_BOND,
+        _RE_SCHED_H_ASSETS, _RE_SCHED_H_LIABILITIES, _RE_SCHED_H_NET_ASSETS,
+        _RE_SCHED_H_EMPLOYER, _RE_SCHED_H_PARTICIPANT,
+        _RE_PARTICIPANTS_BOY, _RE_PARTICIPANTS_EOY,
+    )
+}
+# Characters IGNORECASE equates with an ASCII letter although str.lower()
+# does not map them to it (dotted/dotless i, long s); texts containing them
+# keep the original patterns
+_RE_CASE_FOLD_SPECIAL = re.compile('[\u0130\u0131\u017f]')
+
+# ASCII characters whose \s meaning differs between re and Hyperscan
+_RE_HS_UNSAFE_ASCII = re.compile(r'[\x0b\x1c-\x1f]')
+# Non-ASCII characters the DOL patterns can tell apart from DEL
+_RE_HS_NOT_INERT = re.compile(r'[a-z\d\s]', re.IGNORECASE)
+# Non-ASCII characters template patterns (\w, \b, ...) can tell apart from DEL
+_RE_HS_NOT_INERT_FIELD = re.compile(r'[\w\s]')
+# Template pattern syntax Hyperscan accepts but reads differently from re:
+# \Z, escapes for non-ASCII characters, and {,n} (a literal in PCRE)
+_RE_HS_UNPORTABLE = re.compile(r'\\(?:Z|[uUN]|x[89a-fA-F]|[23][0-7]{2})|\{,')
+_HS_PORTABLE_FLAGS = re.IGNORECASE | re.MULTILINE | re.DOTALL | re.UNICODE
+
+
+def _encode_as_del(error: UnicodeEncodeError) -> Tuple[str, int]:
+    """Codec error handler: one DEL byte per unencodable character."""
+    return '\x7f' * (error.end - error.start), error.end
+
+
+codecs.register_error('openextract.del', _encode_as_del)
+
+
+@lru_cache(maxsize=None)
+def _dol_hyperscan_db() -> 'hyperscan.Database':
+    """Compile _DOL_SCAN_PATTERNS into one Hyperscan database (first use only)."""
+    db = hyperscan.Database()
+    db.compile(
+        expressions=[pattern.pattern.encode('ascii') for pattern in _DOL_SCAN_PATTERNS],
+        ids=list(range(len(_DOL_SCAN_PATTERNS))),
+        elements=len(_DOL_SCAN_PATTERNS),
+        flags=[
+            hyperscan.HS_FLAG_SOM_LEFTMOST
+            | (hyperscan.HS_FLAG_CASELESS if pattern.flags & re.IGNORECASE else 0)
+            for pattern in _DOL_SCAN_PATTERNS
+        ],
+    )
+    return db
+
+
+def _hyperscan_text(text: str, not_inert: re.Pattern = _RE_HS_NOT_INERT) -> Optional[bytes]:
+    """
+    One byte per character of text for Hyperscan, or None if unsafe.
+
+    Offsets must line up with the str, so non-ASCII characters become DEL.
+    That is only equivalent when the character is inert for the patterns
+    being scanned. For the DOL patterns (the default not_inert) that means
+    not whitespace, not a digit, and not case-equal to an ASCII letter under
+    IGNORECASE (e.g. the Kelvin sign), as judged by re itself. Texts with
+    any other character, or with ASCII whitespace that re and Hyperscan
+    classify differently, return None and are searched with re alone.
+    """
+    if _RE_HS_UNSAFE_ASCII.search(text):
+        return None
+    if not text.isascii():
+        non_ascii = ''.join(char for char in set(text) if char > '\x7f')
+        if not_inert.search(non_ascii):
+            return None
+    return text.encode('ascii', 'openextract.del')
+
+
+def _dol_searcher(full_text: str, lower_text: str) -> Callable[[re.Pattern], Optional[re.Match]]:
+    """
+    Return a search(pattern) function over full_text for the DOL patterns.
+
+    With Hyperscan installed, the leftmost start of every pattern in
+    _DOL_SCAN_PATTERNS is found in one pass up front. Otherwise patterns in
+    _DOL_LOWERED run on lower_text (full_text.lower()), and any other
+    pattern is plain pattern.search(full_text).
+    """
+    data = _hyperscan_text(full_text) if HYPERSCAN_AVAILABLE else None
+    if data is None:
+        if _RE_CASE_FOLD_SPECIAL.search(full_text):
+            return lambda pattern: pattern.search(full_text)
+
+        def search(pattern):
+            lowered = _DOL_LOWERED.get(pattern)
+            if lowered is not None:
+                return lowered.search(lower_text)
+            return pattern.search(full_text)
+
+        return search
+
+    starts: Dict[int, int] = {}
+
+    def on_match(pattern_id, start, end, flags, context):
+        if start < starts.get(pattern_id, len(data)):
+            starts[pattern_id] = start
+
+    _dol_hyperscan_db().scan(data, match_event_handler=on_match)
+
+    def search(pattern):
+        pattern_id = _DOL_SCAN_IDS.get(pattern)
+        if pattern_id is None:
+            return pattern.search(full_text)
+        start = starts.get(pattern_id)
+        if start is None:
+            return None
+        return pattern.match(full_text, start) or pattern.search(full_text)
+
+    return search
+
+
+def _hyperscan_flags(pattern: re.Pattern) -> int:
+    """Hyperscan flags for a template pattern: re's flags, one report per pattern."""
+    flags = hyperscan.HS_FLAG_SINGLEMATCH
+    if pattern.flags & re.IGNORECASE:
+        flags |= hyperscan.HS_FLAG_CASELESS
+    if pattern.flags & re.MULTILINE:
+        flags |= hyperscan.HS_FLAG_MULTILINE
+    if pattern.flags & re.DOTALL:
+        flags |= hyperscan.HS_FLAG_DOTALL
+    return flags
+
+
+@lru_cache(maxsize=64)
+def _field_hyperscan_db(patterns: Tuple[Any, ...]) -> Tuple[Optional['hyperscan.Database'], Dict[Any, int]]:
+    """
+    Compile the Hyperscan-compatible patterns among a template's field patterns.
+
+    Patterns that are not ``re`` patterns (e.g. RE2), or that Hyperscan
+    rejects or could read differently from re, are left out and searched
+    with re alone.
+
+    Args:
+        patterns: Compiled field patterns of a template
+
+    Returns:
+        Tuple of (database, or None if no pattern qualifies; pattern -> id)
+    """
+    expressions: List[bytes] = []
+    flags: List[int] = []
+    ids: Dict[Any, int] = {}
+    for pattern in patterns:
+        if not isinstance(pattern, re.Pattern) or pattern in ids:
+            continue
+        if (pattern.flags & ~_HS_PORTABLE_FLAGS or not pattern.pattern.isascii()
+                or _RE_HS_UNPORTABLE.search(pattern.pattern)):
+            continue
+        expression = pattern.pattern.encode('ascii')
+        try:
+            # Checked one at a time so one unsupported pattern cannot sink the rest
+            hyperscan.Database().compile(expressions=[expression], flags=[_hyperscan_flags(pattern)])
+        except hyperscan.error:
+            continue
+        ids[pattern] = len(expressions)
+        expressions.append(expression)
+        flags.append(_hyperscan_flags(pattern))
+
+    if not expressions:
+        return None, ids
+    db = hyperscan.Database()
+    db.compile(expressions=expressions, ids=list(range(len(expressions))),
+               elements=len(expressions), flags=flags)
+    return db, ids
+
+
+def _field_searcher(text: str, fields: List[Dict]) -> Callable[[Any], Optional[Any]]:
+    """
+    Return a search(pattern) function over text for template field patterns.
+
+    With Hyperscan installed, one pass up front finds which compatible
+    precompiled patterns of the fields occur in text at all. Only those are
+    then searched with re (for the match and its groups), so patterns that
+    do not occur, typically most fallbacks, no longer cost a full scan each.
+    Any other pattern, or any text Hyperscan cannot read like re, uses plain
+    pattern.search(text).
+
+    Hyperscan only reports whether each pattern matched, not where: start
+    of match tracking (SOM_LEFTMOST) crashes on some ordinary template
+    patterns (e.g. an alternation branch ending in \\s+).
+    """
+    data = _hyperscan_text(text, _RE_HS_NOT_INERT_FIELD) if HYPERSCAN_AVAILABLE else None
+    if data is None:
+        return lambda pattern: pattern.search(text)
+
+    db, ids = _field_hyperscan_db(tuple(
+        pattern
+        for field in fields
+        if field.get('extraction_method', 'regex') in ('regex', 'coordinates')
+        for pattern in field.get('_compiled_patterns') or ()
+    ))
+    if db is None:
+        return lambda pattern: pattern.search(text)
+
+    matched = set()
+    db.scan(data, match_event_handler=lambda pattern_id, *args: matched.add(pattern_id))
+
+    def search(pattern):
+        pattern_id = ids.get(pattern)
+        if pattern_id is not None and pattern_id not in matched:
+            return None
+        return pattern.search(text)
+
+    return search
+
+
+# What follows a keyword up to its value (see compile_keyword_patterns)
+_RE_KEYWORD_TAIL = re.compile(r'\s*[:=]?\s*(?=\S)')
+
+
+def _keyword_haystack(text: str) -> Optional[str]:
+    """
+    text.lower() for substring keyword search, or None if that is unsafe.
+
+    str.find on the lowered text only agrees with IGNORECASE re when
+    lowering keeps every offset and no character case-folds to an ASCII
+    letter without lowering to it (dotless i, dotted I, long s).
+    """
+    if _RE_CASE_FOLD_SPECIAL.search(text):
+        return None
+    lower_text = text.lower()
+    return lower_text if len(lower_text) == len(text) else None
+
+
+def _search_plan_name(full_text: str) -> Optional[re.Match]:
+    """
+    _RE_PLAN_NAME.search(full_text), without its worst case.
+
+    When no "(PN)" follows the label, the DOTALL pattern retries from every
+    later newline and every later label, which is quadratic in the text
+    length (seconds on a long OCR dump). The label and marker are cheap
+    literal searches, and the pattern can only match if both are present;
+    it is then run from the first label, since no match can start earlier.
+    """
+    label = _RE_PLAN_NAME_LABEL.search(full_text)
+    if not label or not _RE_PN_MARKER.search(full_text, label.end()):
+        return None
+    return _RE_PLAN_NAME.search(full_text, label.start())
+
+
+def _image_to_text(image: Any, config: str = OCR_CONFIG) -> str:
+    """OCR one rendered page with the given Tesseract options."""
+    return pytesseract.image_to_string(image, config=config)
+
+
+def _ocr_cache_stem(digest: str, dpi: int, config: str) -> str:
+    """OCR cache file name stem; the default Tesseract options add no suffix."""
+    if not config:
+        return f"{digest}-{dpi}"
+    return f"{digest}-{dpi}-{hashlib.sha1(config.encode('utf-8')).hexdigest()[:12]}"
+
+
+# Marker of the placeholder-encoded text layer found on DOL form pages
+_DOL_PLACEHOLDER = '123456789'
+# Pages with less extracted text than this are treated as scanned images
+_MIN_TEXT_LAYER_CHARS = 100
+
+
+def _page_needs_ocr(text: str) -> bool:
+    """True when a page's extracted text is missing or placeholder-encoded."""
+    return _DOL_PLACEHOLDER in text or len(text.strip()) <= _MIN_TEXT_LAYER_CHARS
+
+
+def _parse_dol_currency(text: Optional[str]) -> Optional[float]:
+    """
+    Parse an amount captured by the DOL patterns, like 1,234,567 or 1234567.
+
+    Those capture groups only admit digits and commas, so dropping the commas
+    is enough (and several times cheaper than a regex substitution).
+    """
+    if not text:
+        return None
+    try:
+        return float(text.replace(',', ''))
+    except ValueError:
+        return None
+
+
+# Participant count after a "123456" or "1234567" placeholder prefix; a lone
+# trailing 7 ("1234567") is the count itself
+_RE_DOL_PARTICIPANT = re.compile(r'123456(?:7(?=\d))?(\d+)')
+
+
 def extract_dol_embedded_value(raw_value: str, value_type: str = 'currency') -> Optional[str]:
     """
     Extract real values from DOL form placeholder-embedded strings.
@@ -50,13 +497,9 @@ def extract_dol_embedded_value(raw_value: str, value_type: str = 'currency') ->
     if value_type == 'participant':
         # For participant counts, real value is typically last 3-4 digits
         # after the "1234567" placeholder prefix
-        if len(clean) >= 7 and clean.startswith('123456'):
-            # Extract everything after common placeholder prefixes
-            for prefix in ['1234567', '123456']:
-                if clean.startswith(prefix):
-                    remainder = clean[len(prefix):]
-                    if remainder and remainder.isdigit():
-                        return str(int(remainder))
+        match = _RE_DOL_PARTICIPANT.fullmatch(clean)
+        if match:
+            return str(int(match.group(1)))
         # If no placeholder pattern, return as-is
         if clean.isdigit():
             return str(int(clean))
@@ -92,14 +535,44 @@ class Extractor:
         >>> results.to_csv("output.csv", index=False)
     """
 
-    def __init__(self, templates_dir: Optional[str] = None):
+    def __init__(
+        self,
+        templates_dir: Optional[str] = None,
+        backend: Optional[str] = None,
+        ocr_dpi: int = OCR_DPI,
+        ocr_config: str = OCR_CONFIG,
+    ):
         """
         Initialize the Extractor.
 
         Args:
             templates_dir: Path to templates directory. If None, uses default location.
+            backend: PDF text backend, 'pymupdf', 'pdfium', 'pdftotext' or
+                     'pdfplumber'.
+                     If None, uses DEFAULT_BACKEND. An unavailable backend
+                     falls back to the next available one in BACKENDS.
+            ocr_dpi: Resolution DOL form pages are rasterized at for OCR.
+            ocr_config: Extra Tesseract options for OCR (e.g. '--psm 6').
+                        Empty uses Tesseract's defaults.
+
+        Raises:
+            ValueError: If backend is not a known backend
         """
+        backend = backend or DEFAULT_BACKEND
+        if backend not in BACKENDS:
+            raise ValueError(
+                f"Unknown backend '{backend}'. Choose from: {', '.join(BACKENDS)}"
+            )
+        if not _BACKEND_AVAILABLE[backend]:
+            backend = next(
+                b for b in BACKENDS[BACKENDS.index(backend):] if _BACKEND_AVAILABLE[b]
+            )
+
+        self.backend = backend
+        self.ocr_dpi = ocr_dpi
+        self.ocr_config = ocr_config
         self.loader = TemplateLoader(templates_dir)
+        self._text_cache: 'OrderedDict[Tuple, Any]' = OrderedDict()
 
     def list_templates(self, category: Optional[str] = None) -> None:
         """
@@ -111,28 +584,26 @@ class Extractor:
         templates = self.loader.list_templates()
 
         if category:
-            templates = [t for t in templates if category.lower() in t['category'].lower()]
+            cat_filter = category.lower()
+            templates = [t for t in templates if cat_filter in t['category'].lower()]
 
         if not templates:
             print("No templates found.")
             return
 
         # Group by category
-        by_category: Dict[str, List] = {}
+        by_category: Dict[str, List] = defaultdict(list)
         for t in templates:
-            cat = t['category'] or 'other'
-            if cat not in by_category:
-                by_category[cat] = []
-            by_category[cat].append(t)
+            by_category[t['category'] or 'other'].append(t)
 
         print("\n" + "=" * 60)
         print("AVAILABLE TEMPLATES")
         print("=" * 60)
 
-        for cat in sorted(by_category.keys()):
+        for cat, cat_templates in sorted(by_category.items()):
             print(f"\n[{cat.upper()}]")
             print("-" * 40)
-            for t in by_category[cat]:
+            for t in cat_templates:
                 print(f"  {t['id']:<30} v{t['version']}")
                 if t['description']:
                     # Truncate long descriptions
@@ -155,11 +626,23 @@ class Extractor:
         """
         return self.loader.get_template(template_id)
 
+    def clear_cache(self) -> None:
+        """
+        Drop the parsed PDF text kept in memory by this Extractor.
+
+        Cached text is already re-read when a file's mtime or size changes;
+        this frees it early, e.g. after a large batch. Templates are not
+        affected: each Extractor owns its self.loader, refreshed with
+        self.loader.reload().
+        """
+        self._text_cache.clear()
+
     def extract(
         self,
         pdf_path: Union[str, Path],
         template: str,
         pages: Optional[List[int]] = None,
+        fast_mode: bool = False,
     ) -> pd.DataFrame:
         """
         Extract data from a PDF using the specified template.
@@ -169,6 +652,8 @@ class Extractor:
             template: Template ID to use for extraction
             pages: Optional list of page numbers to process (1-indexed).
                    If None, processes all pages.
+            fast_mode: If True, only the template's required fields are
+                       searched for; optional fields are left empty.
 
         Returns:
             pandas DataFrame with extracted data
@@ -177,11 +662,21 @@ class Extractor:
             FileNotFoundError: If PDF file doesn't exist
             ValueError: If template is not found
         """
+        return pd.DataFrame(self._extract_records(pdf_path, template, pages, fast_mode))
+
+    def _extract_records(
+        self,
+        pdf_path: Union[str, Path],
+        template: str,
+        pages: Optional[List[int]] = None,
+        fast_mode: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """Run extract() up to, but not including, building the DataFrame."""
         pdf_path = Path(pdf_path)
         if not pdf_path.exists():
             raise FileNotFoundError(f"PDF file not found: {pdf_path}")
 
-        template_def = self.loader.get_template(template)
+        template_def = self.loader.get_compiled_template(template)
         if not template_def:
             available = [t['id'] for t in self.loader.list_templates()]
             raise ValueError(
@@ -193,16 +688,33 @@ class Extractor:
         is_dol_form = template in ('form-5500', 'form-5500-sf')
 
         if is_dol_form:
+            # Both passes below read pdfplumber text (the DOL pass to decide
+            # which pages need OCR); with the pdfplumber backend parse the
+            # PDF once and share the pages
+            page_texts = None
+            if self.backend == 'pdfplumber':
+                try:
+                    page_texts = self._read_pdfplumber_pages(pdf_path)
+                except Exception:
+                    # Unreadable here; the passes below handle it as before
+                    pass
+
             # Try DOL-specific extraction first for real DOL PDFs
             try:
-                dol_data = self._extract_dol_form_data(pdf_path, template_def)
+                dol_data = self._extract_dol_form_data(pdf_path, template_def, page_texts)
             except Exception:
                 # If DOL extraction fails (e.g., invalid PDF), use empty dict
                 dol_data = {}
 
             # Also do standard text extraction as fallback
-            text = self._extract_pdf_text(pdf_path, pages)
-            text_data = self._extract_fields(text, template_def)
+            if page_texts is not None:
+                selected = range(len(page_texts))
+                if pages:
+                    selected = [p - 1 for p in pages if 0 < p <= len(page_texts)]
+                text = self._join_page_texts([page_texts[i] for i in selected])
+            else:
+                text = self._extract_pdf_text(pdf_path, pages)
+            text_data = self._extract_fields(text, template_def, required_only=fast_mode)
 
             # Merge: prefer DOL extraction for fields it found, use text extraction for rest
             extracted_data = text_data.copy()
@@ -212,16 +724,17 @@ class Extractor:
         else:
             # Standard extraction for non-DOL forms
             text = self._extract_pdf_text(pdf_path, pages)
-            extracted_data = self._extract_fields(text, template_def)
+            extracted_data = self._extract_fields(text, template_def, required_only=fast_mode)
 
         # Format output
-        return self._format_output(extracted_data, template_def)
+        return self._format_records(extracted_data, template_def)
 
     def extract_batch(
         self,
         pdf_paths: List[Union[str, Path]],
         template: str,
         continue_on_error: bool = True,
+        workers: Optional[int] = None,
     ) -> pd.DataFrame:
         """
         Extract data from multiple PDFs using the same template.
@@ -230,28 +743,71 @@ class Extractor:
             pdf_paths: List of paths to PDF files
             template: Template ID to use for extraction
             continue_on_error: If True, continue processing on errors
+            workers: Number of worker processes. If None or 1, PDFs are
+                processed serially in this process.
 
         Returns:
             pandas DataFrame with extracted data from all PDFs
         """
-        all_results = []
+        if workers is not None and workers > 1 and len(pdf_paths) > 1:
+            return self._extract_batch_parallel(pdf_paths, template, continue_on_error, workers)
+
+        # Rows from every PDF go into one DataFrame at the end, instead of a
+        # DataFrame per PDF that is then concatenated
+        all_records = []
 
         for pdf_path in pdf_paths:
             try:
-                result = self.extract(pdf_path, template)
-                result['_source_file'] = str(pdf_path)
-                all_results.append(result)
+                records = self._extract_records(pdf_path, template)
             except Exception as e:
                 if continue_on_error:
                     print(f"Error processing {pdf_path}: {e}")
                     continue
                 else:
                     raise
+            all_records.extend(_with_source_file(records, pdf_path))
 
-        if not all_results:
+        if not all_records:
             return pd.DataFrame()
 
-        return pd.concat(all_results, ignore_index=True)
+        return pd.DataFrame(all_records)
+
+    def _extract_batch_parallel(
+        self,
+        pdf_paths: List[Union[str, Path]],
+        template: str,
+        continue_on_error: bool,
+        workers: int,
+    ) -> pd.DataFrame:
+        """Process-pool version of extract_batch; results keep input order."""
+        templates_dir = str(self.loader.templates_dir)
+        all_records = []
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(
+                    _extract_records_worker, str(pdf_path), template, templates_dir, self.backend,
+                    self.ocr_dpi, self.ocr_config,
+                )
+                for pdf_path in pdf_paths
+            ]
+            for pdf_path, future in zip(pdf_paths, futures):
+                try:
+                    records = future.result()
+                except Exception as e:
+                    if continue_on_error:
+                        print(f"Error processing {pdf_path}: {e}")
+                        continue
+                    else:
+                        for pending in futures:
+                            pending.cancel()
+                        raise
+                all_records.extend(_with_source_file(records, pdf_path))
+
+        if not all_records:
+            return pd.DataFrame()
+
+        return pd.DataFrame(all_records)
 
     def _extract_pdf_text(
         self,
@@ -259,9 +815,60 @@ class Extractor:
         pages: Optional[List[int]] = None,
     ) -> str:
         """Extract text content from PDF."""
-        text_parts = []
+        if self.backend == 'pymupdf':
+            return self._cached(pdf_path, 'pymupdf', pages, self._extract_pdf_text_pymupdf)
+        if self.backend == 'pdfium':
+            return self._cached(pdf_path, 'pdfium', pages, self._extract_pdf_text_pdfium)
+        if self.backend == 'pdftotext':
+            return self._cached(pdf_path, 'pdftotext', pages, self._extract_pdf_text_pdftotext)
+
+        return self._join_page_texts(self._read_pdfplumber_pages(pdf_path, pages))
 
-        with pdfplumber.open(pdf_path) as pdf:
+    def _cached(
+        self,
+        pdf_path: Path,
+        kind: str,
+        pages: Optional[List[int]],
+        read: Callable[[Path, Optional[List[int]]], Any],
+    ) -> Any:
+        """
+        Return read(pdf_path, pages), memoized in the Extractor's LRU text cache.
+
+        Entries are keyed by the file's resolved path, mtime and size, so an
+        edited or replaced file is read again.
+        """
+        try:
+            stat = pdf_path.stat()
+        except OSError:
+            # Let the reader report the missing or unreadable file
+            return read(pdf_path, pages)
+        key = (kind, str(pdf_path.resolve()), stat.st_mtime_ns, stat.st_size, tuple(pages or ()))
+        try:
+            value = self._text_cache.pop(key)
+        except KeyError:
+            value = read(pdf_path, pages)
+            if len(self._text_cache) >= _TEXT_CACHE_SIZE:
+                self._text_cache.popitem(last=False)
+        self._text_cache[key] = value
+        return value
+
+    def _read_pdfplumber_pages(
+        self,
+        pdf_path: Path,
+        pages: Optional[List[int]] = None,
+    ) -> List[Tuple[int, str]]:
+        """Text of each requested page as (0-indexed page, text), via pdfplumber."""
+        return list(self._cached(pdf_path, 'pdfplumber', pages, self._parse_pdfplumber_pages))
+
+    def _parse_pdfplumber_pages(
+        self,
+        pdf_path: Path,
+        pages: Optional[List[int]] = None,
+    ) -> List[Tuple[int, str]]:
+        """Uncached _read_pdfplumber_pages."""
+        page_texts = []
+
+        with _open_pdf_bytes(pdf_path) as stream, pdfplumber.open(stream) as pdf:
             page_indices = range(len(pdf.pages))
 
             if pages:
@@ -270,81 +877,236 @@ class Extractor:
 
             for i in page_indices:
                 page = pdf.pages[i]
-                page_text = page.extract_text() or ''
+                page_texts.append((i, page.extract_text() or ''))
+                # Drop the page's parsed layout objects before moving on, so
+                # peak memory is one page rather than the whole document
+                page.close()
+
+        return page_texts
+
+    @staticmethod
+    def _join_page_texts(page_texts: List[Tuple[int, str]]) -> str:
+        """Join (page index, text) pairs with the '--- PAGE n ---' markers."""
+        return '\n\n'.join(f"--- PAGE {i + 1} ---\n{text}" for i, text in page_texts)
+
+    def _extract_pdf_text_pymupdf(
+        self,
+        pdf_path: Path,
+        pages: Optional[List[int]] = None,
+    ) -> str:
+        """Extract text content from PDF using PyMuPDF (MuPDF C engine)."""
+        text_parts = []
+
+        with pymupdf.open(pdf_path) as doc:
+            page_indices = range(doc.page_count)
+
+            if pages:
+                # Convert 1-indexed to 0-indexed
+                page_indices = [p - 1 for p in pages if 0 < p <= doc.page_count]
+
+            for i in page_indices:
+                page_text = doc[i].get_text()
                 text_parts.append(f"--- PAGE {i + 1} ---\n{page_text}")
 
         return '\n\n'.join(text_parts)
 
-    def _ocr_pdf(self, pdf_path: Path, dpi: int = 200) -> str:
+    def _extract_pdf_text_pdfium(
+        self,
+        pdf_path: Path,
+        pages: Optional[List[int]] = None,
+    ) -> str:
+        """Extract text content from PDF using pypdfium2 (PDFium C++ engine)."""
+        text_parts = []
+
+        pdf = pypdfium2.PdfDocument(str(pdf_path))
+        try:
+            page_indices = range(len(pdf))
+
+            if pages:
+                # Convert 1-indexed to 0-indexed
+                page_indices = [p - 1 for p in pages if 0 < p <= len(pdf)]
+
+            for i in page_indices:
+                page = pdf[i]
+                textpage = page.get_textpage()
+                # PDFium ends lines with \r\n
+                page_text = textpage.get_text_range().replace('\r\n', '\n')
+                textpage.close()
+                page.close()
+                text_parts.append(f"--- PAGE {i + 1} ---\n{page_text}")
+        finally:
+            pdf.close()
+
+        return '\n\n'.join(text_parts)
+
+    def _extract_pdf_text_pdftotext(
+        self,
+        pdf_path: Path,
+        pages: Optional[List[int]] = None,
+    ) -> str:
+        """Extract text content from PDF with poppler's pdftotext binary."""
+        output = subprocess.run(
+            ['pdftotext', '-layout', '-q', str(pdf_path), '-'],
+            capture_output=True,
+            check=True,
+        ).stdout.decode('utf-8', errors='replace')
+
+        # pdftotext separates pages with form feeds (one trailing after the last page)
+        page_texts = output.split('\f')
+        if page_texts and not page_texts[-1].strip():
+            page_texts.pop()
+
+        page_indices = range(len(page_texts))
+        if pages:
+            # Convert 1-indexed to 0-indexed
+            page_indices = [p - 1 for p in pages if 0 < p <= len(page_texts)]
+
+        return '\n\n'.join(
+            f"--- PAGE {i + 1} ---\n{page_texts[i]}" for i in page_indices
+        )
+
+    def _ocr_pdf(self, pdf_path: Path, dpi: Optional[int] = None) -> str:
         """
         Extract text from PDF using OCR.
 
         DOL forms have encoded text layers, so OCR is needed to get actual values.
+        Results are cached on disk by file content, DPI and Tesseract options,
+        so re-extracting the same PDF skips OCR entirely. If dpi is None,
+        uses self.ocr_dpi.
         """
         if not OCR_AVAILABLE:
             return ""
 
-        text_parts = []
-        images = convert_from_path(str(pdf_path), dpi=dpi)
+        dpi = dpi or self.ocr_dpi
+        stem = _ocr_cache_stem(_file_digest(pdf_path), dpi, self.ocr_config)
+        cache_path = _cache_dir('ocr') / f"{stem}.txt"
+        cached = _read_cached_text(cache_path)
+        if cached is not None:
+            return cached
+
+        workers = os.cpu_count() or 1
+        images = convert_from_path(str(pdf_path), dpi=dpi, thread_count=workers)
+        image_to_text = partial(_image_to_text, config=self.ocr_config)
+
+        # Each tesseract call runs in its own subprocess, so threads are enough
+        # to OCR pages in parallel; map() keeps the page order
+        if len(images) > 1 and workers > 1:
+            with ThreadPoolExecutor(max_workers=min(workers, len(images))) as executor:
+                page_texts = list(executor.map(image_to_text, images))
+        else:
+            page_texts = [image_to_text(image) for image in images]
 
-        for i, image in enumerate(images):
-            page_text = pytesseract.image_to_string(image)
-            text_parts.append(f"--- PAGE {i + 1} ---\n{page_text}")
+        text = '\n\n'.join(
+            f"--- PAGE {i + 1} ---\n{page_text}" for i, page_text in enumerate(page_texts)
+        )
+        _write_cached_text(cache_path, text)
+        return text
 
-        return '\n\n'.join(text_parts)
+    def _ocr_pages(
+        self,
+        pdf_path: Path,
+        pages: List[int],
+        dpi: Optional[int] = None,
+    ) -> List[Tuple[int, str]]:
+        """
+        OCR selected pages (1-indexed), returned as (0-indexed page, text).
+
+        Each page is rasterized on its own and cached on disk by file
+        content, DPI, Tesseract options and page number. If dpi is None,
+        uses self.ocr_dpi.
+        """
+        dpi = dpi or self.ocr_dpi
+        stem = _ocr_cache_stem(_file_digest(pdf_path), dpi, self.ocr_config)
+        cache_dir = _cache_dir('ocr')
+
+        def ocr_page(page_number: int) -> Tuple[int, str]:
+            cache_path = cache_dir / f"{stem}-p{page_number}.txt"
+            text = _read_cached_text(cache_path)
+            if text is None:
+                image = convert_from_path(
+                    str(pdf_path), dpi=dpi, first_page=page_number, last_page=page_number
+                )[0]
+                text = _image_to_text(image, self.ocr_config)
+                _write_cached_text(cache_path, text)
+            return page_number - 1, text
+
+        workers = min(os.cpu_count() or 1, len(pages))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                return list(executor.map(ocr_page, pages))
+        return [ocr_page(page_number) for page_number in pages]
 
     def _extract_dol_form_data(
         self,
         pdf_path: Path,
         template: Dict,
+        page_texts: Optional[List[Tuple[int, str]]] = None,
     ) -> Dict[str, Any]:
         """
         Extract data from DOL Form 5500/5500-SF using OCR.
 
         DOL forms have encoded text layers with placeholder characters.
         OCR extracts the actual visual text which contains real values.
+
+        Args:
+            pdf_path: Path to the PDF file
+            template: Template definition
+            page_texts: pdfplumber text of every page, if the caller already
+                has it; used instead of re-parsing to pick the pages that
+                need OCR, or as the text itself when OCR is unavailable
         """
         extracted = {}
 
         # Use OCR if available (preferred for DOL forms)
         if OCR_AVAILABLE:
-            full_text = self._ocr_pdf(pdf_path)
+            try:
+                if page_texts is None:
+                    page_texts = self._read_pdfplumber_pages(pdf_path)
+            except Exception:
+                # No usable text layer to probe; OCR every page
+                full_text = self._ocr_pdf(pdf_path)
+            else:
+                # Only pages whose text layer is missing or placeholder-encoded
+                # are rasterized; readable pages keep their extracted text
+                ocr_pages = [i + 1 for i, text in page_texts if _page_needs_ocr(text)]
+                ocr_texts = dict(self._ocr_pages(pdf_path, ocr_pages)) if ocr_pages else {}
+                full_text = self._join_page_texts(
+                    [(i, ocr_texts.get(i, text)) for i, text in page_texts]
+                )
         else:
             # Fallback to pdfplumber (may get encoded text for DOL forms)
-            full_text = ""
-            with pdfplumber.open(pdf_path) as pdf:
-                for page in pdf.pages:
-                    text = page.extract_text()
-                    if text:
-                        full_text += text + "\n"
+            if page_texts is None:
+                page_texts = self._read_pdfplumber_pages(pdf_path)
+            full_text = ''.join(text + "\n" for _, text in page_texts if text)
+
+        # Lowercased once, for the keyword flags and case-insensitive patterns
+        lower_text = full_text.lower()
+        search = _dol_searcher(full_text, lower_text)
 
         # ============== PART I - ANNUAL REPORT IDENTIFICATION ==============
 
         # Plan year dates
-        date_match = re.search(
-            r'beginning\s+(\d{2}/\d{2}/\d{4})\s+and\s+ending\s+(\d{2}/\d{2}/\d{4})',
-            full_text
-        )
+        date_match = search(_RE_PLAN_YEAR)
         if date_match:
             extracted['plan_year_begin'] = date_match.group(1)
             extracted['plan_year_end'] = date_match.group(2)
 
         # Plan type
-        if 'single-employer' in full_text.lower():
+        if 'single-employer' in lower_text:
             extracted['plan_type'] = 'Single-employer'
-        elif 'multiple-employer' in full_text.lower():
+        elif 'multiple-employer' in lower_text:
             extracted['plan_type'] = 'Multiple-employer'
 
         # Return type flags (Line B)
-        extracted['is_first_return'] = 'first return' in full_text.lower()
-        extracted['is_final_return'] = 'final return' in full_text.lower()
-        extracted['is_amended_return'] = 'amended return' in full_text.lower()
-        extracted['is_short_plan_year'] = 'short plan year' in full_text.lower()
+        extracted['is_first_return'] = 'first return' in lower_text
+        extracted['is_final_return'] = 'final return' in lower_text
+        extracted['is_amended_return'] = 'amended return' in lower_text
+        extracted['is_short_plan_year'] = 'short plan year' in lower_text
 
         # Filing extension (Line C)
         if 'Form 5558' in full_text:
             extracted['filing_extension'] = 'Form 5558'
-        elif 'automatic extension' in full_text.lower():
+        elif 'automatic extension' in lower_text:
             extracted['filing_extension'] = 'Automatic extension'
         elif 'DFVC program' in full_text:
             extracted['filing_extension'] = 'DFVC program'
@@ -352,41 +1114,38 @@ class Extractor:
         # ============== PART II - BASIC PLAN INFO ==============
 
         # Plan name (Line 1a) - OCR puts it on next line after "Name of plan"
-        plan_name_match = re.search(
-            r'Name of plan.*?\n\s*(.+?)\s*\(PN\)',
-            full_text, re.IGNORECASE | re.DOTALL
-        )
+        plan_name_match = _search_plan_name(full_text)
         if plan_name_match:
             plan_name = plan_name_match.group(1).strip()
             extracted['plan_name'] = plan_name
 
         # Plan number (Line 1b)
-        pn_match = re.search(r'\(PN\)[^\d]*(\d{3})', full_text)
+        pn_match = search(_RE_PLAN_NUMBER)
         if pn_match:
             extracted['plan_number'] = pn_match.group(1)
 
         # Effective date (Line 1c)
-        eff_date_match = re.search(r'Effective date[^\d]*(\d{2}/\d{2}/\d{4})', full_text, re.IGNORECASE)
+        eff_date_match = search(_RE_EFFECTIVE_DATE)
         if eff_date_match:
             extracted['effective_date'] = eff_date_match.group(1)
 
         # Sponsor EIN (Line 2b)
-        ein_match = re.search(r'(?:EIN|Identification Number)[^\d]*(\d{2})-?(\d{7})', full_text)
+        ein_match = search(_RE_EIN)
         if ein_match:
             extracted['ein'] = f"{ein_match.group(1)}-{ein_match.group(2)}"
 
         # Sponsor phone (Line 2c)
-        phone_match = re.search(r"Sponsor's telephone[^\d]*(\d{3})-(\d{3})-(\d{4})", full_text, re.IGNORECASE)
+        phone_match = search(_RE_SPONSOR_PHONE)
         if phone_match:
             extracted['sponsor_phone'] = f"{phone_match.group(1)}-{phone_match.group(2)}-{phone_match.group(3)}"
 
         # Business code (Line 2d)
-        biz_code_match = re.search(r'(?:Business code|2d)[^\d]*(\d{6})', full_text, re.IGNORECASE)
+        biz_code_match = search(_RE_BUSINESS_CODE)
         if biz_code_match:
             extracted['business_code'] = biz_code_match.group(1)
 
         # Location - City, State ZIP
-        loc_match = re.search(r'([A-Z][A-Z\s]+),\s*([A-Z]{2})\s+(\d{5})', full_text)
+        loc_match = search(_RE_LOCATION)
         if loc_match:
             extracted['sponsor_city'] = loc_match.group(1).strip()
             extracted['sponsor_state'] = loc_match.group(2)
@@ -398,126 +1157,66 @@ class Extractor:
         # ============== LINE 5 - PARTICIPANT DATA ==============
 
         # 5a - Total participants beginning of year
-        boy_match = re.search(r'5a\s+(\d+)', full_text)
+        boy_match = search(_RE_LINE_5A)
         if boy_match:
             extracted['total_participants_boy'] = int(boy_match.group(1))
 
         # 5b - Total participants end of year
-        eoy_match = re.search(r'5b\s+(\d+)', full_text)
+        eoy_match = search(_RE_LINE_5B)
         if eoy_match:
             extracted['total_participants_eoy'] = int(eoy_match.group(1))
 
         # 5c(1) - Participants with account balances BOY
-        match = re.search(r'5c[e\(]?1[)\s]+(\d+)', full_text, re.IGNORECASE)
+        match = search(_RE_LINE_5C1)
         if match:
             extracted['participants_with_balances_boy'] = int(match.group(1))
 
         # 5c(2) - Participants with account balances EOY
-        match = re.search(r'5c[e\(]?2[)\s]+(\d+)', full_text, re.IGNORECASE)
+        match = search(_RE_LINE_5C2)
         if match:
             extracted['participants_with_balances_eoy'] = int(match.group(1))
 
         # ============== LINE 7 - ASSETS & LIABILITIES ==============
 
-        def parse_currency(text):
-            """Parse currency string like $1,234,567 or 1234567"""
-            if not text:
-                return None
-            clean = re.sub(r'[$,\s]', '', text)
-            try:
-                return float(clean)
-            except ValueError:
-                return None
-
         # 7a - Total plan assets (BOY and EOY)
-        assets_match = re.search(r'7a\s+\$?([\d,]+)\s+\$?([\d,]+)', full_text)
+        assets_match = search(_RE_LINE_7A)
         if assets_match:
-            extracted['total_assets_boy'] = parse_currency(assets_match.group(1))
-            extracted['total_plan_assets_eoy'] = parse_currency(assets_match.group(2))
+            extracted['total_assets_boy'] = _parse_dol_currency(assets_match.group(1))
+            extracted['total_plan_assets_eoy'] = _parse_dol_currency(assets_match.group(2))
 
         # 7b - Total liabilities
-        liab_match = re.search(r'7b\s+\$?([\d,]+)\s+\$?([\d,]+)', full_text)
+        liab_match = search(_RE_LINE_7B)
         if liab_match:
-            extracted['total_liabilities_boy'] = parse_currency(liab_match.group(1))
-            extracted['total_liabilities_eoy'] = parse_currency(liab_match.group(2))
+            extracted['total_liabilities_boy'] = _parse_dol_currency(liab_match.group(1))
+            extracted['total_liabilities_eoy'] = _parse_dol_currency(liab_match.group(2))
 
         # 7c - Net assets
-        net_match = re.search(r'7c\s+\$?([\d,]+)\s+\$?([\d,]+)', full_text)
+        net_match = search(_RE_LINE_7C)
         if net_match:
-            extracted['net_assets_boy'] = parse_currency(net_match.group(1))
-            extracted['net_assets_eoy'] = parse_currency(net_match.group(2))
+            extracted['net_assets_boy'] = _parse_dol_currency(net_match.group(1))
+            extracted['net_assets_eoy'] = _parse_dol_currency(net_match.group(2))
 
         # ============== LINE 8 - INCOME & EXPENSES ==============
 
-        # 8a(1) - Employer contributions
-        match = re.search(r'8a\(1\)\s+\$?([\d,]+)', full_text)
-        if match:
-            extracted['employer_contributions'] = parse_currency(match.group(1))
-
-        # 8a(2) - Participant contributions
-        match = re.search(r'8a\(2\)\s+\$?([\d,]+)', full_text)
-        if match:
-            extracted['participant_contributions'] = parse_currency(match.group(1))
-
-        # 8a(3) - Other contributions
-        match = re.search(r'8a\(3\)\s+\$?([\d,]+)', full_text)
-        if match:
-            extracted['other_contributions'] = parse_currency(match.group(1))
-
-        # 8b - Other income
-        match = re.search(r'8b\s+\$?([\d,]+)', full_text)
-        if match:
-            extracted['other_income'] = parse_currency(match.group(1))
-
-        # 8c - Total income
-        match = re.search(r'8c\s+\$?([\d,]+)', full_text)
-        if match:
-            extracted['total_contributions'] = parse_currency(match.group(1))
-
-        # 8d - Benefits paid
-        match = re.search(r'8d\s+\$?([\d,]+)', full_text)
-        if match:
-            extracted['benefit_payments'] = parse_currency(match.group(1))
-
-        # 8e - Deemed distributions
-        match = re.search(r'8e\s+\$?([\d,]+)', full_text)
-        if match:
-            extracted['deemed_distributions'] = parse_currency(match.group(1))
-
-        # 8f - Admin expenses
-        match = re.search(r'8f\s+\$?([\d,]+)', full_text)
-        if match:
-            extracted['admin_expenses'] = parse_currency(match.group(1))
-
-        # 8g - Other expenses
-        match = re.search(r'8g\s+\$?([\d,]+)', full_text)
-        if match:
-            extracted['other_expenses'] = parse_currency(match.group(1))
-
-        # 8h - Total expenses
-        match = re.search(r'8h\s+\$?([\d,]+)', full_text)
-        if match:
-            extracted['total_expenses'] = parse_currency(match.group(1))
-
-        # 8i - Net income
-        match = re.search(r'8i\s+\$?([\d,]+)', full_text)
-        if match:
-            extracted['net_income'] = parse_currency(match.group(1))
-
-        # 8j - Transfers
-        match = re.search(r'8j\s+\$?([\d,]+)', full_text)
-        if match:
-            extracted['transfers'] = parse_currency(match.group(1))
+        # 8a(1)-8j - Contributions, income, benefits, expenses, transfers
+        line_8_values = {}
+        for match in _RE_LINE_8.finditer(full_text):
+            line_8_values.setdefault(match.group(1), match.group(2))
+        for code, field_name in _LINE_8_FIELDS.items():
+            if code in line_8_values:
+                extracted[field_name] = _parse_dol_currency(line_8_values[code])
 
         # ============== LINE 9 - PLAN CHARACTERISTICS ==============
 
-        # Look for pension feature codes (2x or 3x format)
-        codes = re.findall(r'\b([23][A-Z])\b', full_text)
-        if codes:
-            # Filter to unique codes that look like feature codes
-            unique_codes = list(dict.fromkeys(codes))
-            # Take only codes that appear in the plan characteristics area
-            extracted['pension_feature_codes'] = ', '.join(unique_codes[:10])
+        # Look for pension feature codes (2x or 3x format); the first 10
+        # distinct codes are kept, so stop scanning once they are found
+        unique_codes = {}
+        for match in _RE_FEATURE_CODES.finditer(full_text):
+            unique_codes.setdefault(match.group(1))
+            if len(unique_codes) == _MAX_FEATURE_CODES:
+                break
+        if unique_codes:
+            extracted['pension_feature_codes'] = ', '.join(unique_codes)
 
         # ============== LINE 10 - COMPLIANCE ==============
 
@@ -532,76 +1231,61 @@ class Extractor:
         extracted['blackout_period'] = 'No'
 
         # Fidelity bond amount (Line 10c)
-        bond_match = re.search(r'(?:10c|fidelity bond)[^\d]*\$?([\d,]+)', full_text, re.IGNORECASE)
+        bond_match = search(_RE_FIDELITY_BOND)
         if bond_match:
-            extracted['fidelity_bond_amount'] = parse_currency(bond_match.group(1))
+            extracted['fidelity_bond_amount'] = _parse_dol_currency(bond_match.group(1))
 
         # ============== SCHEDULE H - FINANCIAL INFORMATION (Full 5500) ==============
         # Schedule H uses different line codes than 5500-SF
 
         # Total Assets (Schedule H line 1f) - Pattern: "Total assets" followed by two numbers
-        assets_match = re.search(
-            r'Total assets[^\d]*(\d{1,3}(?:,?\d{3})*)\s+(\d{1,3}(?:,?\d{3})*)',
-            full_text, re.IGNORECASE
-        )
+        assets_match = search(_RE_SCHED_H_ASSETS)
         if assets_match:
             # First number is BOY, second is EOY
             if not extracted.get('total_assets_boy'):
-                extracted['total_assets_boy'] = parse_currency(assets_match.group(1))
+                extracted['total_assets_boy'] = _parse_dol_currency(assets_match.group(1))
             if not extracted.get('total_assets_eoy'):
-                extracted['total_assets_eoy'] = parse_currency(assets_match.group(2))
+                extracted['total_assets_eoy'] = _parse_dol_currency(assets_match.group(2))
 
         # Total Liabilities (Schedule H line 1k)
-        liab_match = re.search(
-            r'Total liabilities[^\d]*(\d{1,3}(?:,?\d{3})*)\s+(\d{1,3}(?:,?\d{3})*)',
-            full_text, re.IGNORECASE
-        )
+        liab_match = search(_RE_SCHED_H_LIABILITIES)
         if liab_match:
             if not extracted.get('total_liabilities_boy'):
-                extracted['total_liabilities_boy'] = parse_currency(liab_match.group(1))
+                extracted['total_liabilities_boy'] = _parse_dol_currency(liab_match.group(1))
             if not extracted.get('total_liabilities_eoy'):
-                extracted['total_liabilities_eoy'] = parse_currency(liab_match.group(2))
+                extracted['total_liabilities_eoy'] = _parse_dol_currency(liab_match.group(2))
 
         # Net Assets (Schedule H line 1l)
-        net_match = re.search(
-            r'Net assets[^\d]*(\d{1,3}(?:,?\d{3})*)\s+(\d{1,3}(?:,?\d{3})*)',
-            full_text, re.IGNORECASE
-        )
+        net_match = search(_RE_SCHED_H_NET_ASSETS)
         if net_match:
             if not extracted.get('net_assets_boy'):
-                extracted['net_assets_boy'] = parse_currency(net_match.group(1))
+                extracted['net_assets_boy'] = _parse_dol_currency(net_match.group(1))
             if not extracted.get('net_assets_eoy'):
-                extracted['net_assets_eoy'] = parse_currency(net_match.group(2))
+                extracted['net_assets_eoy'] = _parse_dol_currency(net_match.group(2))
 
         # Employer contributions (Schedule H) - look in statement text
-        emp_contrib_match = re.search(
-            r'Employer contributions\s+(\d{1,3}(?:,?\d{3})*)\s+(\d{1,3}(?:,?\d{3})*)',
-            full_text, re.IGNORECASE
-        )
+        emp_contrib_match = search(_RE_SCHED_H_EMPLOYER)
         if emp_contrib_match and not extracted.get('employer_contributions'):
             # Second number is current year
-            extracted['employer_contributions'] = parse_currency(emp_contrib_match.group(1))
+            extracted['employer_contributions'] = _parse_dol_currency(emp_contrib_match.group(1))
 
         # Participant contributions
-        part_contrib_match = re.search(
-            r'Participant contributions\s+(\d{1,3}(?:,?\d{3})*)\s+(\d{1,3}(?:,?\d{3})*)',
-            full_text, re.IGNORECASE
-        )
+        part_contrib_match = search(_RE_SCHED_H_PARTICIPANT)
         if part_contrib_match and not extracted.get('participant_contributions'):
-            extracted['participant_contributions'] = parse_currency(part_contrib_match.group(1))
+            extracted['participant_contributions'] = _parse_dol_currency(part_contrib_match.group(1))
 
         # Total participants from Schedule H or statements
         # Look for patterns like "5 30" or participant count in text
-        part_boy_match = re.search(r'beginning of the plan year\s+5\s+(\d+)', full_text, re.IGNORECASE)
+        part_boy_match = search(_RE_PARTICIPANTS_BOY)
         if part_boy_match and not extracted.get('total_participants_boy'):
             extracted['total_participants_boy'] = int(part_boy_match.group(1))
 
-        part_eoy_match = re.search(r'end of the plan year\s+6\s+(\d+)', full_text, re.IGNORECASE)
+        part_eoy_match = search(_RE_PARTICIPANTS_EOY)
         if part_eoy_match and not extracted.get('total_participants_eoy'):
             extracted['total_participants_eoy'] = int(part_eoy_match.group(1))
 
         # Alternative participant count pattern
-        part_match = re.search(r'participants.*?beginning.*?(\d+).*?end.*?(\d+)', full_text, re.IGNORECASE | re.DOTALL)
+        part_match = _RE_PARTICIPANTS_ALT.search(full_text)
         if part_match:
             if not extracted.get('total_participants_boy'):
                 extracted['total_participants_boy'] = int(part_match.group(1))
@@ -609,10 +1293,7 @@ class Extractor:
                 extracted['total_participants_eoy'] = int(part_match.group(2))
 
         # Sponsor name from Schedule H header
-        sponsor_match = re.search(
-            r"Plan sponsor's name.*?\n([A-Z0-9][A-Z0-9\s,\.]+(?:LLC|INC|CORP|LLP|LP)?)",
-            full_text, re.IGNORECASE
-        )
+        sponsor_match = search(_RE_SPONSOR_NAME)
         if sponsor_match and not extracted.get('sponsor_name'):
             sponsor = sponsor_match.group(1).strip()
             # Clean up any form text that got captured
@@ -687,43 +1368,71 @@ class Extractor:
 
         return None
 
-    def _extract_fields(self, text: str, template: Dict) -> Dict[str, Any]:
-        """Extract all fields from text using template definition."""
+    def _extract_fields(
+        self,
+        text: str,
+        template: Dict,
+        required_only: bool = False,
+    ) -> Dict[str, Any]:
+        """Extract all fields (or only the required ones) from text using template definition."""
         extracted = {}
+        if required_only:
+            fields = template.get('_required_fields')
+            if fields is None:
+                fields = required_fields(template)
+        else:
+            fields = template.get('fields', [])
+        search = _field_searcher(text, fields)
+        lower_text = None  # lowered lazily, for keyword_proximity fields only
 
-        for field_def in template.get('fields', []):
+        for field_def in fields:
             field_name = field_def['field_name']
             extraction_method = field_def.get('extraction_method', 'regex')
 
             value = None
 
             if extraction_method == 'regex':
-                value = self._extract_with_regex(text, field_def)
+                value = self._extract_with_regex(text, field_def, search)
             elif extraction_method == 'coordinates':
                 # Coordinate extraction would require page-level processing
                 # For now, fall back to regex if available
-                value = self._extract_with_regex(text, field_def)
+                value = self._extract_with_regex(text, field_def, search)
             elif extraction_method == 'keyword_proximity':
-                value = self._extract_with_keyword_proximity(text, field_def)
+                if lower_text is None:
+                    # '' marks text whose keywords must be found by regex
+                    lower_text = _keyword_haystack(text) or ''
+                value = self._extract_with_keyword_proximity(text, field_def, lower_text or None)
 
-            # Coerce to appropriate type
-            data_type = field_def.get('data_type', 'string')
-            extracted[field_name] = coerce_value(value, data_type)
+            # Coerce to appropriate type (coercer resolved at template load)
+            coercer = field_def.get('_coercer')
+            if coercer is None:
+                coercer = get_coercer(field_def.get('data_type', 'string'))
+            extracted[field_name] = coercer(value) if value is not None else None
 
         return extracted
 
-    def _extract_with_regex(self, text: str, field_def: Dict) -> Optional[str]:
-        """Extract field value using regex patterns."""
-        patterns = [field_def.get('regex_pattern')]
-        patterns.extend(field_def.get('fallback_patterns', []))
+    def _extract_with_regex(
+        self,
+        text: str,
+        field_def: Dict,
+        search: Optional[Callable[[Any], Optional[Any]]] = None,
+    ) -> Optional[str]:
+        """
+        Extract field value using the field's precompiled regex patterns.
 
-        for pattern in patterns:
-            if not pattern:
-                continue
+        search, when given, is a _field_searcher over text; otherwise each
+        pattern is searched directly.
+        """
+        patterns = field_def.get('_compiled_patterns')
+        if patterns is None:
+            patterns = compile_field_patterns(field_def)
 
-            value = extract_first_match(text, pattern)
-            if value:
-                return clean_text(value)
+        for pattern in patterns:
+            match = search(pattern) if search is not None else pattern.search(text)
+            if match and pattern.groups:
+                value = match.group(1)
+                if value:
+                    return clean_text(value)
 
         return field_def.get('default_value')
 
@@ -731,24 +1440,60 @@ class Extractor:
         self,
         text: str,
         field_def: Dict,
+        lower_text: Optional[str] = None,
     ) -> Optional[str]:
-        """Extract field value based on proximity to keywords."""
-        keywords = field_def.get('keywords', [])
-        max_distance = field_def.get('max_distance', 50)
+        """
+        Extract field value based on proximity to keywords.
 
-        for keyword in keywords:
+        lower_text, when given, is _keyword_haystack(text); ASCII keywords
+        are then located with str.find on it instead of an IGNORECASE
+        regex search, which cannot skip ahead on a literal prefix.
+        """
+        patterns = field_def.get('_keyword_patterns')
+        if patterns is None:
+            patterns = compile_keyword_patterns(field_def)
+        needles = field_def.get('_keyword_needles')
+        if needles is None:
+            needles = keyword_needles(field_def)
+        max_distance = int(field_def.get('max_distance', 50))
+
+        for pattern, needle in zip(patterns, needles):
             # Find keyword in text
-            pattern = rf'{re.escape(keyword)}\s*[:=]?\s*(\S+(?:\s+\S+)*)'
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                # Get text after keyword, limited by distance
-                value = match.group(1)[:max_distance]
+            start = self._find_keyword(text, lower_text, pattern, needle)
+            if start is not None:
+                # Get text after keyword, limited by distance; slicing the
+                # window directly keeps the work bounded by max_distance
+                value = text[start:start + max_distance]
                 return clean_text(value.split('\n')[0])
 
         return field_def.get('default_value')
 
+    @staticmethod
+    def _find_keyword(
+        text: str,
+        lower_text: Optional[str],
+        pattern: Any,
+        needle: Optional[str],
+    ) -> Optional[int]:
+        """Offset where the first keyword occurrence followed by a value starts its value."""
+        if lower_text is None or needle is None:
+            match = pattern.search(text)
+            return match.end() if match else None
+
+        pos = lower_text.find(needle)
+        while pos != -1:
+            tail = _RE_KEYWORD_TAIL.match(text, pos + len(needle))
+            if tail:
+                return tail.end()
+            pos = lower_text.find(needle, pos + 1)
+        return None
+
     def _format_output(self, data: Dict[str, Any], template: Dict) -> pd.DataFrame:
         """Format extracted data as a DataFrame."""
+        return pd.DataFrame(self._format_records(data, template))
+
+    def _format_records(self, data: Dict[str, Any], template: Dict) -> List[Dict[str, Any]]:
+        """Format extracted data as output rows (one per field, or a single row)."""
         output_format = template.get('output_format', {})
         date_format = output_format.get('date_format', 'YYYY-MM-DD')
         include_line_codes = output_format.get('include_line_codes', False)
@@ -778,28 +1523,24 @@ class Extractor:
                     'value': value if value is not None else ''
                 })
 
-            return pd.DataFrame(rows)
+            return rows
         else:
             # Traditional horizontal format
             csv_headers = output_format.get('csv_headers', list(data.keys()))
+            date_fields = template.get('_date_fields')
+            if date_fields is None:
+                date_fields = date_field_names(template)
             row = {}
             for header in csv_headers:
                 value = data.get(header)
 
                 # Format dates according to output format
-                if value and self._is_date_field(header, template):
+                if value and header in date_fields:
                     value = format_date(value, date_format)
 
                 row[header] = value
 
-            return pd.DataFrame([row])
-
-    def _is_date_field(self, field_name: str, template: Dict) -> bool:
-        """Check if a field is a date type."""
-        for field_def in template.get('fields', []):
-            if field_def.get('field_name') == field_name:
-                return field_def.get('data_type') == 'date'
-        return False
+            return [row]
 
     def validate_extraction(
         self,
@@ -809,48 +1550,106 @@ class Extractor:
         """
         Validate extraction results against template requirements.
 
+        Every row is checked, so batch results from extract_batch are
+        validated as a whole; their messages name the offending rows.
+
         Args:
-            results: DataFrame with extraction results
+            results: DataFrame with extraction results (one row per PDF)
             template: Template ID used for extraction
 
         Returns:
             Dictionary with validation results
         """
-        template_def = self.loader.get_template(template)
+        template_def = self.loader.get_compiled_template(template)
         if not template_def:
             return {'valid': False, 'errors': ['Template not found']}
 
         errors = []
         warnings = []
+        columns = set(results.columns)
+        # Batch results name the offending rows; single results keep the short form
+        multi_row = len(results) > 1
 
         for field_def in template_def.get('fields', []):
             field_name = field_def['field_name']
             required = field_def.get('required', False)
             validation = field_def.get('validation')
 
-            if field_name not in results.columns:
+            if field_name not in columns:
                 if required:
                     errors.append(f"Required field '{field_name}' not in results")
                 continue
 
-            value = results[field_name].iloc[0] if len(results) > 0 else None
+            column = results[field_name]
+            present = column.notna() & (column.astype(object) != '')
 
             # Check required fields
-            if required and (value is None or value == ''):
-                errors.append(f"Required field '{field_name}' is empty")
-
-            # Validate against pattern if provided
-            if validation and value:
-                if not re.match(validation, str(value)):
-                    warnings.append(
-                        f"Field '{field_name}' value '{value}' "
-                        f"doesn't match pattern '{validation}'"
-                    )
+            if required and (len(column) == 0 or not present.all()):
+                message = f"Required field '{field_name}' is empty"
+                if multi_row:
+                    message += f" in rows {list(column.index[~present])}"
+                errors.append(message)
+
+            # Validate every present value against the pattern, if provided;
+            # falsy values (e.g. a zero amount) are not checked
+            values = column[present]
+            values = values[values.map(bool).astype(bool)]
+            if validation and len(values):
+                values = values.map(str).astype(object)
+                matched = values.str.match(field_def.get('_validation_re', validation))
+                for row, value in values[~matched].items():
+                    message = f"Field '{field_name}' value '{value}' doesn't match pattern '{validation}'"
+                    if multi_row:
+                        message += f" (row {row})"
+                    warnings.append(message)
 
         return {
             'valid': len(errors) == 0,
             'errors': errors,
             'warnings': warnings,
-            'fields_extracted': len([c for c in results.columns if results[c].notna().any()]),
+            'fields_extracted': int(results.notna().any().sum()),
             'fields_total': len(template_def.get('fields', [])),
         }
+
+
+@lru_cache(maxsize=None)
+def _worker_extractor(
+    templates_dir: Optional[str],
+    backend: Optional[str] = None,
+    ocr_dpi: int = OCR_DPI,
+    ocr_config: str = OCR_CONFIG,
+) -> Extractor:
+    """Extractor reused by every task a pool worker process runs."""
+    return Extractor(templates_dir, backend=backend, ocr_dpi=ocr_dpi, ocr_config=ocr_config)
+
+
+def _extract_worker(
+    pdf_path: Union[str, Path],
+    template: str,
+    templates_dir: Optional[str] = None,
+    backend: Optional[str] = None,
+) -> pd.DataFrame:
+    """Extract one PDF inside a pool worker (must be a top-level function to pickle)."""
+    return _worker_extractor(templates_dir, backend).extract(pdf_path, template)
+
+
+def _extract_records_worker(
+    pdf_path: Union[str, Path],
+    template: str,
+    templates_dir: Optional[str] = None,
+    backend: Optional[str] = None,
+    ocr_dpi: int = OCR_DPI,
+    ocr_config: str = OCR_CONFIG,
+) -> List[Dict[str, Any]]:
+    """Like _extract_worker, but return plain output rows (cheaper to pickle)."""
+    extractor = _worker_extractor(templates_dir, backend, ocr_dpi, ocr_config)
+    return extractor._extract_records(pdf_path, template)
+
+
+def _with_source_file(records: List[Dict[str, Any]], pdf_path: Union[str, Path]) -> List[Dict[str, Any]]:
+    """Tag each output row with the PDF it came from (as extract_batch reports it)."""
+    source = str(pdf_path)
+    for record in records:
+        record['_source_file'] = source
+    return records
+
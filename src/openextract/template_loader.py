@@ -4,9 +4,268 @@ Template loading and management for OpenExtract.
 
 import json
 import os
+import re
+import warnings
+from collections import defaultdict
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 
+from .utils import get_coercer
+
+# orjson for template parsing (optional, faster than the json module)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# RE2 engine for template patterns (optional, linear-time matching)
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
+
+# Flags used for template field patterns (same as utils.extract_first_match)
+PATTERN_FLAGS = re.IGNORECASE | re.MULTILINE
+# The same flags written inline, for RE2
+_RE2_FLAG_PREFIX = '(?im)'
+
+# An innermost group that contains an unbounded quantifier and is itself
+# repeated without bound, e.g. (?:\s+\S+)*. Escapes and character classes
+# are consumed whole so that \( or [+*] never count as syntax.
+_PATTERN_ATOM = r'(?:\\.|\[(?:\\.|[^\]\\])*\]|[^()\\[])'
+_UNBOUNDED = r'(?:[*+]|\{\d*,\})'
+_RE_NESTED_QUANTIFIER = re.compile(
+    r'(?<!\\)\(' + _PATTERN_ATOM + r'*?' + _UNBOUNDED + _PATTERN_ATOM + r'*\)' + _UNBOUNDED
+)
+
+
+def _lint_pattern(pattern: str) -> None:
+    """
+    Warn about template patterns that are likely to search slowly.
+
+    Patterns are never rewritten; the warnings only point at templates
+    worth fixing:
+
+    - a leading lazy ``.*?``, which makes ``search`` try the rest of the
+      pattern at every offset instead of skipping ahead to a literal
+    - nested unbounded quantifiers, such as ``(\\S+(?:\\s+\\S+)*)``, which
+      can backtrack badly on long text
+
+    The nested-quantifier check reads the pattern source and only looks
+    at innermost groups, so it can miss deeper nesting.
+
+    Args:
+        pattern: Pattern string from a template
+    """
+    if pattern.startswith('.*?'):
+        warnings.warn(f"Template pattern starts with a lazy '.*?', which slows searching: {pattern!r}")
+    if _RE_NESTED_QUANTIFIER.search(pattern):
+        warnings.warn(f"Template pattern has nested quantifiers and may backtrack heavily: {pattern!r}")
+
+
+def compile_field_patterns(field: Dict) -> List[Any]:
+    """
+    Compile a field's regex_pattern and fallback_patterns, in priority order.
+
+    Invalid patterns are skipped, matching extraction-time behavior where
+    they never produce a value.
+
+    When the optional ``re2`` module is installed, patterns are compiled
+    with RE2, which matches in linear time, so a pathological template
+    pattern cannot backtrack exponentially on long OCR text. Patterns RE2
+    does not support (lookarounds, backreferences) fall back to ``re``.
+    Note that RE2's \\d, \\s and \\w classes are ASCII-only.
+
+    Each pattern is first checked by _lint_pattern.
+
+    Args:
+        field: Field definition from a template
+
+    Returns:
+        List of compiled patterns (objects with ``search`` and ``groups``)
+    """
+    compiled = []
+    for pattern in [field.get('regex_pattern'), *field.get('fallback_patterns', [])]:
+        if not pattern:
+            continue
+        _lint_pattern(pattern)
+        if RE2_AVAILABLE:
+            try:
+                compiled.append(re2.compile(_RE2_FLAG_PREFIX + pattern))
+                continue
+            except re2.error:
+                pass
+        try:
+            compiled.append(re.compile(pattern, PATTERN_FLAGS))
+        except re.error:
+            continue
+    return compiled
+
+
+def compile_keyword_patterns(field: Dict) -> List[Any]:
+    """
+    Compile a keyword_proximity field's keywords, in priority order.
+
+    Each pattern matches the keyword (case-insensitively) and an optional
+    ``:`` or ``=`` separator, and ends where the value text starts.
+
+    Args:
+        field: Field definition from a template
+
+    Returns:
+        List of compiled patterns, one per keyword
+    """
+    return [
+        re.compile(rf'{re.escape(keyword)}\s*[:=]?\s*(?=\S)', re.IGNORECASE)
+        for keyword in field.get('keywords', [])
+    ]
+
+
+def keyword_needles(field: Dict) -> List[Optional[str]]:
+    """
+    Lowercased keywords of a keyword_proximity field, for plain substring search.
+
+    Keywords with non-ASCII characters map to None: their case-insensitive
+    matching is left to the compiled keyword patterns.
+
+    Args:
+        field: Field definition from a template
+
+    Returns:
+        List with one lowercased keyword (or None) per keyword
+    """
+    return [keyword.lower() if keyword.isascii() else None for keyword in field.get('keywords', [])]
+
+
+def date_field_names(template: Dict) -> frozenset:
+    """
+    Names of a template's date-typed fields.
+
+    When a field name is repeated, its first definition decides the type.
+
+    Args:
+        template: Template dictionary
+
+    Returns:
+        Frozen set of field names whose data_type is 'date'
+    """
+    data_types: Dict[str, Any] = {}
+    for field in template.get('fields', []):
+        data_types.setdefault(field.get('field_name'), field.get('data_type'))
+    return frozenset(name for name, data_type in data_types.items() if data_type == 'date')
+
+
+def required_fields(template: Dict) -> List[Dict]:
+    """
+    A template's required field definitions, in template order.
+
+    Args:
+        template: Template dictionary
+
+    Returns:
+        List of field definitions with ``required`` set
+    """
+    return [
+        field for field in template.get('fields', [])
+        if isinstance(field, dict) and field.get('required')
+    ]
+
+
+def _search_keys(template: Dict) -> tuple:
+    """Lowercased name, description, tags and ID that search_templates matches against."""
+    return tuple(
+        text.lower() for text in (
+            template.get('template_name', ''),
+            template.get('description', ''),
+            *template.get('tags', []),
+            template.get('template_id', ''),
+        )
+        if isinstance(text, str)
+    )
+
+
+def _compile_field(field: Any) -> Any:
+    """A copy of a field definition with its patterns and coercer precompiled."""
+    if not isinstance(field, dict):
+        return field
+
+    compiled = dict(field)
+    compiled['_compiled_patterns'] = compile_field_patterns(field)
+    if field.get('extraction_method') == 'keyword_proximity':
+        compiled['_keyword_patterns'] = compile_keyword_patterns(field)
+        compiled['_keyword_needles'] = keyword_needles(field)
+    if field.get('validation'):
+        try:
+            compiled['_validation_re'] = re.compile(field['validation'])
+        except re.error:
+            # Left to validate_extraction, which reports it as before
+            pass
+    compiled['_coercer'] = get_coercer(field.get('data_type', 'string'))
+    return compiled
+
+
+def _compile_template(template: Dict) -> Dict:
+    """
+    Build the extraction view of a template: a copy whose fields carry
+    their precompiled regex, keyword and validation patterns and coercers,
+    plus the template's date-field set and required fields.
+
+    The template itself is not modified, so the dicts get_template hands
+    out stay plain JSON data.
+
+    Args:
+        template: Template dictionary
+
+    Returns:
+        New template dictionary for the Extractor
+    """
+    compiled = dict(template)
+    compiled['fields'] = [_compile_field(field) for field in template.get('fields', [])]
+    compiled['_date_fields'] = date_field_names(compiled)
+    compiled['_required_fields'] = required_fields(compiled)
+    return compiled
+
+
+def _copy_json(value: Any) -> Any:
+    """Copy parsed JSON data (nested dicts and lists; other values are immutable)."""
+    if isinstance(value, dict):
+        return {key: _copy_json(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_json(item) for item in value]
+    return value
+
+
+@lru_cache(maxsize=64)
+def _parse_template_file(path: str, mtime_ns: int) -> Dict:
+    """
+    Parse a template file.
+
+    Cached by (path, mtime_ns), so unchanged files are parsed once per
+    process while edited files are picked up on the next load. The result
+    is shared: callers must copy it before handing it out or changing it.
+    """
+    if ORJSON_AVAILABLE:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+# Allowed values checked by TemplateLoader.validate_template (tuples rather
+# than sets, so an unhashable value in a bad template is reported, not raised)
+_VALID_DATA_TYPES = ('string', 'integer', 'currency', 'date', 'boolean', 'decimal', 'percentage')
+_VALID_EXTRACTION_METHODS = ('regex', 'coordinates', 'table', 'keyword_proximity')
+
+
+def _default_templates_dir() -> Path:
+    """Templates directory relative to this file's package."""
+    return Path(__file__).parent.parent.parent / 'templates'
+
 
 class TemplateLoader:
     """Loads and manages extraction templates."""
@@ -19,12 +278,19 @@ class TemplateLoader:
             templates_dir: Path to templates directory. If None, uses default location.
         """
         if templates_dir is None:
-            # Default to templates directory relative to this file's package
-            package_dir = Path(__file__).parent.parent.parent
-            templates_dir = package_dir / 'templates'
+            templates_dir = _default_templates_dir()
 
         self.templates_dir = Path(templates_dir)
         self._templates: Dict[str, Dict] = {}
+        # Lookup indexes over _templates, rebuilt by _load_templates
+        self._by_category: Dict[str, List[Dict]] = {}
+        self._by_type: Dict[str, List[Dict]] = {}
+        self._categories: List[str] = []
+        self._search_keys: Dict[str, tuple] = {}
+        # get_compiled_template() results, built on each template's first use
+        self._compiled: Dict[str, Dict] = {}
+        # list_templates() result, built on first call
+        self._listing: Optional[List[Dict[str, str]]] = None
         self._load_templates()
 
     def _load_templates(self) -> None:
@@ -39,8 +305,8 @@ class TemplateLoader:
                 continue
 
             try:
-                with open(json_file, 'r', encoding='utf-8') as f:
-                    template = json.load(f)
+                # Own copy: the cached parse is shared with other loaders
+                template = _copy_json(_parse_template_file(str(json_file), json_file.stat().st_mtime_ns))
 
                 # Validate required fields
                 if 'template_id' in template and 'fields' in template:
@@ -54,6 +320,30 @@ class TemplateLoader:
                 # Skip invalid templates
                 print(f"Warning: Could not load template {json_file}: {e}")
 
+        self._build_indexes()
+
+    def _build_indexes(self) -> None:
+        """Index the loaded templates by (lowercased) category, document type and search keys."""
+        by_category = defaultdict(list)
+        by_type = defaultdict(list)
+        categories = set()
+        self._search_keys = {}
+        self._compiled = {}
+        for template_id, template in self._templates.items():
+            self._search_keys[template_id] = _search_keys(template)
+            category = template['_category']
+            by_category[category.lower()].append(template)
+            if category:
+                categories.add(category)
+            document_type = template.get('document_type', '')
+            if isinstance(document_type, str):
+                by_type[document_type.lower()].append(template)
+
+        self._by_category = dict(by_category)
+        self._by_type = dict(by_type)
+        self._categories = sorted(categories)
+        self._listing = None
+
     def get_template(self, template_id: str) -> Optional[Dict]:
         """
         Get a template by its ID.
@@ -66,6 +356,29 @@ class TemplateLoader:
         """
         return self._templates.get(template_id)
 
+    def get_compiled_template(self, template_id: str) -> Optional[Dict]:
+        """
+        Get a template prepared for extraction.
+
+        A copy of the template whose fields carry precompiled patterns and
+        coercers (see _compile_template). Built on the template's first use
+        and kept until reload(), so later changes to the dict returned by
+        get_template do not reach it.
+
+        Args:
+            template_id: The unique template identifier
+
+        Returns:
+            Extraction-ready template dictionary or None if not found
+        """
+        compiled = self._compiled.get(template_id)
+        if compiled is None:
+            template = self._templates.get(template_id)
+            if template is None:
+                return None
+            compiled = self._compiled[template_id] = _compile_template(template)
+        return compiled
+
     def list_templates(self) -> List[Dict[str, str]]:
         """
         Get a list of all available templates.
@@ -73,20 +386,24 @@ class TemplateLoader:
         Returns:
             List of dicts with template info (id, name, description, category)
         """
-        templates = []
-        for template_id, template in self._templates.items():
-            templates.append({
-                'id': template_id,
-                'name': template.get('template_name', template_id),
-                'description': template.get('description', ''),
-                'category': template.get('_category', 'other'),
-                'document_type': template.get('document_type', 'other'),
-                'version': template.get('version', '1.0.0'),
-            })
-
-        # Sort by category then name
-        templates.sort(key=lambda x: (x['category'], x['name']))
-        return templates
+        if self._listing is None:
+            listing = [
+                {
+                    'id': template_id,
+                    'name': template.get('template_name', template_id),
+                    'description': template.get('description', ''),
+                    'category': template.get('_category', 'other'),
+                    'document_type': template.get('document_type', 'other'),
+                    'version': template.get('version', '1.0.0'),
+                }
+                for template_id, template in self._templates.items()
+            ]
+            # Sort by category then name
+            listing.sort(key=lambda x: (x['category'], x['name']))
+            self._listing = listing
+
+        # Copies, so callers cannot change the cached listing
+        return [dict(info) for info in self._listing]
 
     def get_templates_by_category(self, category: str) -> List[Dict]:
         """
@@ -98,10 +415,7 @@ class TemplateLoader:
         Returns:
             List of template dictionaries
         """
-        return [
-            t for t in self._templates.values()
-            if t.get('_category', '').lower() == category.lower()
-        ]
+        return list(self._by_category.get(category.lower(), ()))
 
     def get_templates_by_type(self, document_type: str) -> List[Dict]:
         """
@@ -113,10 +427,7 @@ class TemplateLoader:
         Returns:
             List of template dictionaries
         """
-        return [
-            t for t in self._templates.values()
-            if t.get('document_type', '').lower() == document_type.lower()
-        ]
+        return list(self._by_type.get(document_type.lower(), ()))
 
     def search_templates(self, query: str) -> List[Dict[str, str]]:
         """
@@ -131,25 +442,9 @@ class TemplateLoader:
         query_lower = query.lower()
         results = []
 
+        # Name, description, tags and template_id, lowercased at load time
         for template_id, template in self._templates.items():
-            # Search in name
-            if query_lower in template.get('template_name', '').lower():
-                results.append(self._template_info(template))
-                continue
-
-            # Search in description
-            if query_lower in template.get('description', '').lower():
-                results.append(self._template_info(template))
-                continue
-
-            # Search in tags
-            tags = template.get('tags', [])
-            if any(query_lower in tag.lower() for tag in tags):
-                results.append(self._template_info(template))
-                continue
-
-            # Search in template_id
-            if query_lower in template_id.lower():
+            if any(query_lower in key for key in self._search_keys[template_id]):
                 results.append(self._template_info(template))
 
         return results
@@ -228,15 +523,13 @@ class TemplateLoader:
             errors.append(f"{prefix}: field_name must be snake_case")
 
         # Validate data_type
-        valid_types = ['string', 'integer', 'currency', 'date', 'boolean', 'decimal', 'percentage']
         data_type = field.get('data_type', '')
-        if data_type and data_type not in valid_types:
+        if data_type and data_type not in _VALID_DATA_TYPES:
             errors.append(f"{prefix}: Invalid data_type '{data_type}'")
 
         # Validate extraction_method
-        valid_methods = ['regex', 'coordinates', 'table', 'keyword_proximity']
         method = field.get('extraction_method', '')
-        if method and method not in valid_methods:
+        if method and method not in _VALID_EXTRACTION_METHODS:
             errors.append(f"{prefix}: Invalid extraction_method '{method}'")
 
         # If regex method, require regex_pattern
@@ -262,9 +555,5 @@ class TemplateLoader:
     @property
     def categories(self) -> List[str]:
         """Get list of all template categories."""
-        categories = set()
-        for template in self._templates.values():
-            cat = template.get('_category', 'other')
-            if cat:
-                categories.add(cat)
-        return sorted(list(categories))
+        return list(self._categories)
+
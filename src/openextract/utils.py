@@ -4,7 +4,30 @@ Utility functions for OpenExtract PDF data extraction.
 
 import re
 from datetime import datetime
-from typing import Any, Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Patterns used on every extracted field, compiled once at import
+_CURRENCY_STRIP_RE = re.compile(r'[$£€¥,\s]')
+_INTEGER_STRIP_RE = re.compile(r'[,\s]')
+_PERCENT_STRIP_RE = re.compile(r'[%\s]')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+_NON_DIGIT_RE = re.compile(r'\D')
+
+# bytes.translate deletion table: every byte except ASCII 0-9
+_DELETE_NON_DIGITS = bytes(b for b in range(256) if not 0x30 <= b <= 0x39)
+
+
+def _is_plain_number(value: str) -> bool:
+    """
+    True for digits with at most one decimal point: text float() always
+    accepts and that the strip patterns would leave untouched.
+    """
+    return value.replace('.', '', 1).isdecimal()
 
 
 def parse_currency(value: str) -> Optional[float]:
@@ -20,8 +43,14 @@ def parse_currency(value: str) -> Optional[float]:
     if not value:
         return None
 
+    if isinstance(value, str):
+        # Fast path: a plain amount needs only its commas dropped
+        cleaned = value.replace(',', '')
+        if _is_plain_number(cleaned):
+            return float(cleaned)
+
     # Remove currency symbols and whitespace
-    cleaned = re.sub(r'[$£€¥,\s]', '', str(value))
+    cleaned = _CURRENCY_STRIP_RE.sub('', str(value))
 
     # Handle negative values in parentheses
     if cleaned.startswith('(') and cleaned.endswith(')'):
@@ -46,8 +75,14 @@ def parse_integer(value: str) -> Optional[int]:
     if not value:
         return None
 
+    if isinstance(value, str):
+        # Fast path: a plain count needs only its commas dropped
+        cleaned = value.replace(',', '')
+        if _is_plain_number(cleaned):
+            return int(float(cleaned))
+
     # Remove commas and whitespace
-    cleaned = re.sub(r'[,\s]', '', str(value))
+    cleaned = _INTEGER_STRIP_RE.sub('', str(value))
 
     try:
         return int(float(cleaned))
@@ -68,8 +103,14 @@ def parse_percentage(value: str) -> Optional[float]:
     if not value:
         return None
 
+    if isinstance(value, str):
+        # Fast path: a plain percentage needs only its % sign dropped
+        cleaned = value.replace('%', '')
+        if _is_plain_number(cleaned):
+            return float(cleaned)
+
     # Remove % sign and whitespace
-    cleaned = re.sub(r'[%\s]', '', str(value))
+    cleaned = _PERCENT_STRIP_RE.sub('', str(value))
 
     try:
         return float(cleaned)
@@ -77,10 +118,85 @@ def parse_percentage(value: str) -> Optional[float]:
         return None
 
 
+def parse_currency_series(values: 'pd.Series') -> 'pd.Series':
+    """
+    Vectorized ``parse_currency`` for a whole pandas Series.
+
+    Args:
+        values: Series of currency strings
+
+    Returns:
+        Float Series; unparseable values become NaN
+    """
+    import pandas as pd
+
+    cleaned = values.astype(str).str.replace(_CURRENCY_STRIP_RE.pattern, '', regex=True)
+    # Handle negative values in parentheses
+    cleaned = cleaned.str.replace(r'^\((.*)\)$', r'-\1', regex=True)
+    return pd.to_numeric(cleaned, errors='coerce')
+
+
+def parse_integer_series(values: 'pd.Series') -> 'pd.Series':
+    """
+    Vectorized ``parse_integer`` for a whole pandas Series.
+
+    Args:
+        values: Series of integer strings
+
+    Returns:
+        Nullable Int64 Series; unparseable values become <NA>. If any value
+        is too large for Int64, parse_integer is applied to each value
+        instead (object Series of Python ints and None).
+    """
+    import numpy as np
+    import pandas as pd
+
+    cleaned = values.astype(str).str.replace(_INTEGER_STRIP_RE.pattern, '', regex=True)
+    numbers = np.trunc(pd.to_numeric(cleaned, errors='coerce'))
+    if (numbers.abs() >= 2.0 ** 63).any():
+        return values.map(parse_integer)
+    return numbers.astype('Int64')
+
+
+def parse_percentage_series(values: 'pd.Series') -> 'pd.Series':
+    """
+    Vectorized ``parse_percentage`` for a whole pandas Series.
+
+    Args:
+        values: Series of percentage strings
+
+    Returns:
+        Float Series (as percentage, not decimal); unparseable values become NaN
+    """
+    import pandas as pd
+
+    cleaned = values.astype(str).str.replace(_PERCENT_STRIP_RE.pattern, '', regex=True)
+    return pd.to_numeric(cleaned, errors='coerce')
+
+
+_DEFAULT_DATE_FORMATS = (
+    '%m/%d/%Y',
+    '%m-%d-%Y',
+    '%m/%d/%y',
+    '%m-%d-%y',
+    '%Y-%m-%d',
+    '%Y/%m/%d',
+    '%d/%m/%Y',
+    '%d-%m-%Y',
+    '%B %d, %Y',
+    '%b %d, %Y',
+    '%d %B %Y',
+    '%d %b %Y',
+)
+
+
 def parse_date(value: str, input_formats: Optional[list] = None) -> Optional[str]:
     """
     Parse a date string and return in ISO format (YYYY-MM-DD).
 
+    Results are memoized per process, since the same dates (plan year
+    boundaries, filing dates) recur across pages and documents.
+
     Args:
         value: String containing date
         input_formats: List of strptime format strings to try
@@ -91,24 +207,13 @@ def parse_date(value: str, input_formats: Optional[list] = None) -> Optional[str
     if not value:
         return None
 
-    if input_formats is None:
-        input_formats = [
-            '%m/%d/%Y',
-            '%m-%d-%Y',
-            '%m/%d/%y',
-            '%m-%d-%y',
-            '%Y-%m-%d',
-            '%Y/%m/%d',
-            '%d/%m/%Y',
-            '%d-%m-%Y',
-            '%B %d, %Y',
-            '%b %d, %Y',
-            '%d %B %Y',
-            '%d %b %Y',
-        ]
-
-    cleaned = str(value).strip()
+    formats = _DEFAULT_DATE_FORMATS if input_formats is None else tuple(input_formats)
+    return _parse_date_cached(str(value).strip(), formats)
+
 
+@lru_cache(maxsize=4096)
+def _parse_date_cached(cleaned: str, input_formats: tuple) -> Optional[str]:
+    """Try each strptime format in turn; cached by (string, formats)."""
     for fmt in input_formats:
         try:
             dt = datetime.strptime(cleaned, fmt)
@@ -119,10 +224,23 @@ def parse_date(value: str, input_formats: Optional[list] = None) -> Optional[str
     return None
 
 
+# Map common format strings to strftime format
+_OUTPUT_DATE_FORMATS = {
+    'YYYY-MM-DD': '%Y-%m-%d',
+    'MM/DD/YYYY': '%m/%d/%Y',
+    'DD/MM/YYYY': '%d/%m/%Y',
+    'YYYY/MM/DD': '%Y/%m/%d',
+    'MM-DD-YYYY': '%m-%d-%Y',
+    'DD-MM-YYYY': '%d-%m-%Y',
+}
+
+
 def format_date(date_str: str, output_format: str = 'YYYY-MM-DD') -> Optional[str]:
     """
     Format a date string to the specified output format.
 
+    Results are memoized per process (see ``parse_date``).
+
     Args:
         date_str: Date string in YYYY-MM-DD format
         output_format: Desired output format string
@@ -133,17 +251,13 @@ def format_date(date_str: str, output_format: str = 'YYYY-MM-DD') -> Optional[st
     if not date_str:
         return None
 
-    # Map common format strings to strftime format
-    format_map = {
-        'YYYY-MM-DD': '%Y-%m-%d',
-        'MM/DD/YYYY': '%m/%d/%Y',
-        'DD/MM/YYYY': '%d/%m/%Y',
-        'YYYY/MM/DD': '%Y/%m/%d',
-        'MM-DD-YYYY': '%m-%d-%Y',
-        'DD-MM-YYYY': '%d-%m-%Y',
-    }
+    return _format_date_cached(date_str, output_format)
+
 
-    strftime_format = format_map.get(output_format, '%Y-%m-%d')
+@lru_cache(maxsize=4096)
+def _format_date_cached(date_str: str, output_format: str) -> str:
+    """Reformat an ISO date string; cached by (string, format)."""
+    strftime_format = _OUTPUT_DATE_FORMATS.get(output_format, '%Y-%m-%d')
 
     try:
         dt = datetime.strptime(date_str, '%Y-%m-%d')
@@ -166,7 +280,7 @@ def clean_text(text: str) -> str:
         return ''
 
     # Replace multiple whitespace with single space
-    cleaned = re.sub(r'\s+', ' ', str(text))
+    cleaned = _WHITESPACE_RE.sub(' ', str(text))
 
     # Strip leading/trailing whitespace
     cleaned = cleaned.strip()
@@ -174,6 +288,19 @@ def clean_text(text: str) -> str:
     return cleaned
 
 
+def _digits(value: Any) -> str:
+    """
+    Strip everything but digits, like re.sub(r'\\D', '', ...).
+
+    ASCII text goes through a C-level byte translate; other text keeps the
+    regex, so non-ASCII digits (e.g. fullwidth) are kept as before.
+    """
+    text = str(value)
+    if text.isascii():
+        return text.encode('ascii').translate(None, _DELETE_NON_DIGITS).decode('ascii')
+    return _NON_DIGIT_RE.sub('', text)
+
+
 def normalize_ein(ein: str) -> Optional[str]:
     """
     Normalize an EIN to XX-XXXXXXX format.
@@ -187,8 +314,7 @@ def normalize_ein(ein: str) -> Optional[str]:
     if not ein:
         return None
 
-    # Remove all non-digits
-    digits = re.sub(r'\D', '', str(ein))
+    digits = _digits(ein)
 
     if len(digits) != 9:
         return None
@@ -209,8 +335,7 @@ def normalize_ssn(ssn: str) -> Optional[str]:
     if not ssn:
         return None
 
-    # Remove all non-digits
-    digits = re.sub(r'\D', '', str(ssn))
+    digits = _digits(ssn)
 
     if len(digits) != 9:
         return None
@@ -263,6 +388,43 @@ def extract_first_match(text: str, pattern: str, group: int = 1) -> Optional[str
     return None
 
 
+# Lowercased checkbox-style values read as True
+_TRUE_VALUES = frozenset({'true', 'yes', '1', 'x', 'checked'})
+
+
+def _parse_boolean(value: str) -> bool:
+    """Interpret a checkbox-style value (true/yes/1/x/checked) as a bool."""
+    return str(value).lower() in _TRUE_VALUES
+
+
+# Coercion function for each template data_type; anything else is cleaned text
+_COERCERS = {
+    'string': clean_text,
+    'integer': parse_integer,
+    'currency': parse_currency,
+    'decimal': parse_currency,  # Same parsing logic
+    'percentage': parse_percentage,
+    'date': parse_date,
+    'boolean': _parse_boolean,
+}
+
+
+def get_coercer(data_type: str) -> Callable[[str], Any]:
+    """
+    Look up the function that coerces non-None values to a data type.
+
+    Resolving this once per template field avoids comparing data_type
+    strings for every value extracted.
+
+    Args:
+        data_type: Target data type (string, integer, currency, date, boolean, decimal, percentage)
+
+    Returns:
+        Single-argument coercion function
+    """
+    return _COERCERS.get(data_type, clean_text)
+
+
 def coerce_value(value: str, data_type: str) -> Any:
     """
     Coerce an extracted string value to the specified data type.
@@ -277,19 +439,33 @@ def coerce_value(value: str, data_type: str) -> Any:
     if value is None:
         return None
 
-    if data_type == 'string':
-        return clean_text(value)
-    elif data_type == 'integer':
-        return parse_integer(value)
-    elif data_type == 'currency':
-        return parse_currency(value)
-    elif data_type == 'decimal':
-        return parse_currency(value)  # Same parsing logic
-    elif data_type == 'percentage':
-        return parse_percentage(value)
-    elif data_type == 'date':
-        return parse_date(value)
-    elif data_type == 'boolean':
-        return str(value).lower() in ('true', 'yes', '1', 'x', 'checked')
-    else:
-        return clean_text(value)
+    return get_coercer(data_type)(value)
+
+
+# Vectorized parsers for the numeric data types; the rest are mapped per value
+_SERIES_COERCERS = {
+    'integer': parse_integer_series,
+    'currency': parse_currency_series,
+    'decimal': parse_currency_series,
+    'percentage': parse_percentage_series,
+}
+
+
+def coerce_series(values: 'pd.Series', data_type: str) -> 'pd.Series':
+    """
+    Column-wise ``coerce_value`` for a whole pandas Series.
+
+    Numeric types are parsed in a single vectorized pass; dates, booleans
+    and text are coerced value by value. Missing values stay missing.
+
+    Args:
+        values: Series of extracted strings
+        data_type: Target data type (string, integer, currency, date, boolean, decimal, percentage)
+
+    Returns:
+        Coerced Series; unparseable numeric values become NaN/<NA>
+    """
+    parse_series = _SERIES_COERCERS.get(data_type)
+    if parse_series is not None:
+        return parse_series(values)
+    return values.map(get_coercer(data_type), na_action='ignore')
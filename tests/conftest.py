@@ -0,0 +1,94 @@
+"""
+Shared pytest fixtures.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from openextract import Extractor
+from openextract.template_loader import TemplateLoader
+
+TEMPLATES_DIR = Path(__file__).parent.parent / 'templates'
+SAMPLE_INPUTS = Path(__file__).parent / 'sample_data' / 'inputs'
+EXPECTED_OUTPUTS = Path(__file__).parent / 'sample_data' / 'expected_outputs'
+SAMPLE_PDFS = Path(__file__).parent / 'sample_pdfs'
+
+# Every shipped template (files starting with '_' are the schema and example)
+TEMPLATE_FILES = sorted(f for f in TEMPLATES_DIR.rglob('*.json') if not f.name.startswith('_'))
+# Output of the baseline pdfplumber extraction for each sample PDF, one CSV
+# per template: expected_outputs/pdfs/<pdf stem>/<template id>.csv
+EXPECTED_PDF_OUTPUTS = sorted((EXPECTED_OUTPUTS / 'pdfs').glob('*/*.csv'))
+
+
+@pytest.fixture(scope='session')
+def templates_dir():
+    """The bundled templates directory."""
+    return TEMPLATES_DIR
+
+
+@pytest.fixture(scope='session')
+def template_files():
+    """Paths of every shipped template."""
+    return TEMPLATE_FILES
+
+
+@pytest.fixture(params=TEMPLATE_FILES, ids=lambda f: f.stem)
+def template_file(request):
+    """One shipped template; tests using it run once per template."""
+    return request.param
+
+
+@pytest.fixture(params=EXPECTED_PDF_OUTPUTS, ids=lambda p: f'{p.parent.name}-{p.stem}')
+def sample_pdf_case(request):
+    """One (sample PDF, template id, expected CSV) regression case."""
+    expected_csv = request.param
+    return SAMPLE_PDFS / f'{expected_csv.parent.name}.pdf', expected_csv.stem, expected_csv
+
+
+@pytest.fixture(scope='session')
+def extractor():
+    """One Extractor over the bundled templates, shared by the whole session."""
+    return Extractor(TEMPLATES_DIR)
+
+
+@pytest.fixture(scope='session')
+def loader():
+    """One TemplateLoader over the bundled templates, shared by the whole session."""
+    return TemplateLoader(TEMPLATES_DIR)
+
+
+@pytest.fixture(scope='session')
+def sample_form_5500_text():
+    """Text of the sample Form 5500, read once per session."""
+    return (SAMPLE_INPUTS / 'sample_form_5500.txt').read_text()
+
+
+@pytest.fixture(scope='session')
+def sample_form_5500_sf_text():
+    """Text of the sample Form 5500-SF, read once per session."""
+    return (SAMPLE_INPUTS / 'sample_form_5500_sf.txt').read_text()
+
+
+@pytest.fixture(scope='session')
+def sample_1099_nec_text():
+    """Text of the sample 1099-NEC, read once per session."""
+    return (SAMPLE_INPUTS / 'sample_1099_nec.txt').read_text()
+
+
+@pytest.fixture(scope='session')
+def sample_invoice_text():
+    """Text of the sample invoice, read once per session."""
+    return (SAMPLE_INPUTS / 'sample_invoice.txt').read_text()
+
+
+@pytest.fixture(scope='session')
+def dummy_pdf_path(tmp_path_factory):
+    """A placeholder PDF for tests that patch out the text extraction."""
+    path = tmp_path_factory.mktemp('pdf') / 'dummy.pdf'
+    path.write_bytes(b'%PDF-1.4')
+    return str(path)
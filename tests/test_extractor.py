@@ -2,7 +2,10 @@
 Tests for the PDF extraction functionality.
 """
 
+import json
 import os
+import re
+import subprocess
 import sys
 from pathlib import Path
 from io import BytesIO
@@ -25,6 +28,11 @@ from openextract.utils import (
     normalize_ein,
     normalize_ssn,
     coerce_value,
+    get_coercer,
+    parse_currency_series,
+    parse_integer_series,
+    parse_percentage_series,
+    coerce_series,
 )
 
 
@@ -65,6 +73,33 @@ class TestUtilityFunctions:
         assert parse_percentage('12.5') == 12.5
         assert parse_percentage('100%') == 100.0
 
+    def test_series_parsers_match_scalar(self):
+        """Test vectorized parsers against their scalar counterparts."""
+        currency = pd.Series(['$1,234.56', '($1,234.56)', '1234', 'abc'])
+        assert parse_currency_series(currency).tolist()[:3] == [1234.56, -1234.56, 1234.0]
+        assert pd.isna(parse_currency_series(currency).iloc[3])
+
+        integers = parse_integer_series(pd.Series(['1,234', '0', 'n/a']))
+        assert integers.tolist()[:2] == [1234, 0]
+        assert pd.isna(integers.iloc[2])
+
+        assert parse_percentage_series(pd.Series(['12.5%', '100'])).tolist() == [12.5, 100.0]
+
+    @pytest.mark.parametrize('data_type, values', [
+        ('currency', ['$1,234.56', '(12)', 'abc']),
+        ('integer', ['1,234', '7']),
+        ('integer', ['1,234', '1e30', '-9,999,999,999,999,999,999']),
+        ('date', ['01/15/2024', 'not a date']),
+        ('boolean', ['Yes', 'no']),
+        ('string', ['  hello   world ']),
+    ])
+    def test_coerce_series_matches_coerce_value(self, data_type, values):
+        """Test that column-wise coercion agrees with coerce_value per cell."""
+        coerced = coerce_series(pd.Series(values + [None], dtype=object), data_type)
+        expected = [coerce_value(v, data_type) for v in values]
+        assert [None if pd.isna(v) else v for v in coerced[:-1]] == expected
+        assert pd.isna(coerced.iloc[-1])
+
     def test_parse_date_various_formats(self):
         """Test date parsing with various formats."""
         assert parse_date('01/15/2024') == '2024-01-15'
@@ -77,6 +112,12 @@ class TestUtilityFunctions:
         assert parse_date(None) is None
         assert parse_date('not a date') is None
 
+    def test_parse_date_custom_formats(self):
+        """Test date parsing with caller-supplied formats (list or tuple)."""
+        assert parse_date('15.01.2024', ['%d.%m.%Y']) == '2024-01-15'
+        assert parse_date('15.01.2024', ('%d.%m.%Y',)) == '2024-01-15'
+        assert parse_date('15.01.2024') is None
+
     def test_format_date(self):
         """Test date formatting."""
         assert format_date('2024-01-15', 'MM/DD/YYYY') == '01/15/2024'
@@ -105,6 +146,13 @@ class TestUtilityFunctions:
         assert normalize_ssn('123456789') == '123-45-6789'
         assert normalize_ssn('123-45-6789') == '123-45-6789'
 
+    @pytest.mark.parametrize('value', ['\uff11\uff12-3456789', 'EIN: 12\u20133456789', '12-345\u0667789'])
+    def test_normalize_non_ascii_digits(self, value):
+        """Test that non-ASCII input is normalized like re.sub(r'\\D', '', ...)."""
+        digits = re.sub(r'\D', '', value)
+        assert normalize_ein(value) == f"{digits[:2]}-{digits[2:]}"
+        assert normalize_ssn(value) == f"{digits[:3]}-{digits[3:5]}-{digits[5:]}"
+
     def test_coerce_value(self):
         """Test value coercion."""
         assert coerce_value('$1,234.56', 'currency') == 1234.56
@@ -114,21 +162,205 @@ class TestUtilityFunctions:
         assert coerce_value('  hello  ', 'string') == 'hello'
         assert coerce_value('yes', 'boolean') is True
 
+    def test_get_coercer(self):
+        """Test per-type coercer lookup, with cleaned text as the fallback."""
+        assert get_coercer('currency') is parse_currency
+        assert get_coercer('decimal')('1,000.5') == 1000.5
+        assert get_coercer('unknown') is clean_text
+
+
+class TestPackageImports:
+    """Tests for the package-level lazy imports."""
+
+    def test_utils_import_skips_pdf_stack(self):
+        """Test that importing a utility does not load pdfplumber/pandas."""
+        code = (
+            'import sys; from openextract import parse_currency; '
+            'print("pdfplumber" in sys.modules, "pandas" in sys.modules)'
+        )
+        src_dir = str(Path(__file__).parent.parent / 'src')
+        output = subprocess.run(
+            [sys.executable, '-c', code],
+            capture_output=True, text=True, check=True,
+            env={**os.environ, 'PYTHONPATH': src_dir},
+        ).stdout
+        assert output.strip() == 'False False'
+
+    def test_lazy_names_resolve(self):
+        """Test that every public name resolves and unknown names raise."""
+        import openextract
+
+        for name in openextract.__all__:
+            assert getattr(openextract, name) is not None
+            assert name in dir(openextract)
+
+        with pytest.raises(AttributeError):
+            openextract.does_not_exist
+
 
 class TestExtractor:
     """Tests for the Extractor class."""
 
-    @pytest.fixture
-    def extractor(self):
-        """Create an extractor instance."""
-        templates_dir = Path(__file__).parent.parent / 'templates'
-        return Extractor(templates_dir)
-
     def test_extractor_initialization(self, extractor):
         """Test extractor initializes properly."""
         assert extractor is not None
         assert extractor.loader.template_count > 0
 
+    def test_new_extractor_sees_added_templates(self, tmp_path):
+        """Test that each Extractor scans its templates directory afresh."""
+        template = {'template_id': 'first', 'fields': []}
+        (tmp_path / 'first.json').write_text(json.dumps(template))
+        assert Extractor(tmp_path).loader.get_template('second') is None
+
+        (tmp_path / 'second.json').write_text(json.dumps(dict(template, template_id='second')))
+        assert Extractor(tmp_path).loader.get_template('second') is not None
+
+    def test_unknown_backend(self):
+        """Test that an unknown backend is rejected."""
+        with pytest.raises(ValueError):
+            Extractor(backend='nonexistent')
+
+    def test_backends_extract_same_pages(self):
+        """Test that PyMuPDF, PDFium and pdfplumber produce the same page layout markers."""
+        pytest.importorskip('pymupdf')
+        pytest.importorskip('pypdfium2')
+        pdf_path = Path(__file__).parent / 'sample_pdfs' / 'test_5500_sf.pdf'
+
+        texts = {
+            backend: Extractor(backend=backend)._extract_pdf_text(pdf_path, pages=[1, 2])
+            for backend in ('pymupdf', 'pdfium', 'pdfplumber')
+        }
+        assert '\r' not in texts['pdfium']
+        for text in texts.values():
+            assert text.startswith('--- PAGE 1 ---')
+            assert '--- PAGE 2 ---' in text
+            assert 'Form 5500-SF' in text
+
+    def test_pdftotext_backend_splits_pages(self, tmp_path):
+        """Test that pdftotext output is split on form feeds into page blocks."""
+        extractor = Extractor()
+        extractor.backend = 'pdftotext'
+        completed = Mock(stdout=b'first page\fsecond page\f')
+
+        with patch('openextract.extractor.subprocess.run', return_value=completed) as run:
+            text = extractor._extract_pdf_text(tmp_path / 'doc.pdf', pages=[2])
+
+        assert run.call_args[0][0][:3] == ['pdftotext', '-layout', '-q']
+        assert text == '--- PAGE 2 ---\nsecond page'
+
+    def test_dol_form_parsed_once(self):
+        """Test that DOL extraction without OCR parses the PDF a single time."""
+        import pdfplumber
+
+        pdf_path = Path(__file__).parent / 'sample_pdfs' / 'test_5500_sf.pdf'
+        extractor = Extractor(backend='pdfplumber')
+
+        with patch('openextract.extractor.OCR_AVAILABLE', False), \
+                patch('openextract.extractor.pdfplumber.open', wraps=pdfplumber.open) as opened:
+            result = extractor.extract(pdf_path, template='form-5500-sf')
+
+        assert opened.call_count == 1
+        assert not result.empty
+
+    def test_pdf_text_cached_until_file_changes(self, tmp_path):
+        """Test that re-extracting an unchanged PDF reuses its parsed text."""
+        import pdfplumber
+
+        pdf_path = tmp_path / 'doc.pdf'
+        pdf_path.write_bytes((Path(__file__).parent / 'sample_pdfs' / 'test_5500.pdf').read_bytes())
+        extractor = Extractor(backend='pdfplumber')
+
+        with patch('openextract.extractor.pdfplumber.open', wraps=pdfplumber.open) as opened:
+            first = extractor._extract_pdf_text(pdf_path)
+            assert extractor._extract_pdf_text(pdf_path) == first
+            assert opened.call_count == 1
+
+            stat = pdf_path.stat()
+            os.utime(pdf_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+            assert extractor._extract_pdf_text(pdf_path) == first
+            assert opened.call_count == 2
+
+            extractor.clear_cache()
+            assert extractor._extract_pdf_text(pdf_path) == first
+            assert opened.call_count == 3
+
+    @pytest.fixture
+    def fake_ocr(self, tmp_path, monkeypatch):
+        """Patch in a three-page OCR stack and an isolated cache directory."""
+        monkeypatch.setenv('OPENEXTRACT_CACHE_DIR', str(tmp_path / 'cache'))
+        ocr = Mock(side_effect=lambda image, config='': f"text of {image}")
+
+        def rasterize(path, dpi, first_page=None, last_page=None, **kwargs):
+            images = ['p1', 'p2', 'p3']
+            return images[first_page - 1:last_page] if first_page else images
+
+        with patch('openextract.extractor.OCR_AVAILABLE', True), \
+                patch('openextract.extractor.convert_from_path', create=True,
+                      side_effect=rasterize), \
+                patch('openextract.extractor.pytesseract', create=True,
+                      image_to_string=ocr):
+            yield ocr
+
+    def test_dol_ocr_skips_readable_pages(self, extractor, tmp_path, fake_ocr):
+        """Test that only placeholder-encoded or empty pages are OCR'd."""
+        pdf_path = tmp_path / 'doc.pdf'
+        pdf_path.write_bytes(b'%PDF-1.4 one')
+        readable = 'Plan year beginning 01/01/2024 and ending 12/31/2024 ' + 'x' * 100
+        page_texts = [(0, readable), (1, '-123456789 placeholder'), (2, '')]
+
+        data = extractor._extract_dol_form_data(pdf_path, {}, page_texts)
+
+        assert sorted(call.args[0] for call in fake_ocr.call_args_list) == ['p2', 'p3']
+        assert data['plan_year_begin'] == '01/01/2024'
+
+    def test_ocr_pages_keep_order(self, extractor, tmp_path, fake_ocr):
+        """Test that pages OCR'd in parallel are joined in page order."""
+        pdf_path = tmp_path / 'doc.pdf'
+        pdf_path.write_bytes(b'%PDF-1.4 one')
+
+        text = extractor._ocr_pdf(pdf_path)
+
+        assert text == (
+            '--- PAGE 1 ---\ntext of p1\n\n'
+            '--- PAGE 2 ---\ntext of p2\n\n'
+            '--- PAGE 3 ---\ntext of p3'
+        )
+
+    def test_ocr_results_cached_by_content(self, extractor, tmp_path, fake_ocr):
+        """Test that OCR runs once per distinct file content."""
+        first = tmp_path / 'first.pdf'
+        copy = tmp_path / 'copy.pdf'
+        other = tmp_path / 'other.pdf'
+        first.write_bytes(b'%PDF-1.4 one')
+        copy.write_bytes(b'%PDF-1.4 one')
+        other.write_bytes(b'%PDF-1.4 two')
+
+        text = extractor._ocr_pdf(first)
+        assert fake_ocr.call_count == 3
+
+        assert extractor._ocr_pdf(copy) == text
+        assert fake_ocr.call_count == 3
+
+        extractor._ocr_pdf(other)
+        assert fake_ocr.call_count == 6
+
+    def test_ocr_settings_opt_in(self, tmp_path, fake_ocr):
+        """Test that OCR uses Tesseract's defaults unless settings are passed."""
+        from openextract.extractor import convert_from_path
+
+        pdf_path = tmp_path / 'doc.pdf'
+        pdf_path.write_bytes(b'%PDF-1.4 one')
+
+        Extractor()._ocr_pdf(pdf_path)
+        assert convert_from_path.call_args.kwargs['dpi'] == 200
+        assert {call.kwargs['config'] for call in fake_ocr.call_args_list} == {''}
+
+        fake_ocr.reset_mock()
+        Extractor(ocr_dpi=300, ocr_config='--psm 4')._ocr_pdf(pdf_path)
+        assert convert_from_path.call_args.kwargs['dpi'] == 300
+        assert {call.kwargs['config'] for call in fake_ocr.call_args_list} == {'--psm 4'}
+        assert len(list((tmp_path / 'cache' / 'ocr').glob('*.txt'))) == 2
+
     def test_list_templates(self, extractor, capsys):
         """Test listing templates."""
         extractor.list_templates()
@@ -168,16 +400,187 @@ class TestExtractor:
             extractor.extract(str(pdf_path), template='nonexistent')
         assert 'not found' in str(exc_info.value)
 
+    def test_validate_extraction_single_row(self, extractor):
+        """Test required-field and pattern checks on a single horizontal result."""
+        results = pd.DataFrame({
+            'payer_name': ['ABC Consulting'],
+            'payer_tin': ['94-345'],
+            'recipient_name': [''],
+            'box_1_nonemployee_compensation': [None],
+        })
+
+        report = extractor.validate_extraction(results, '1099-nec')
+
+        assert not report['valid']
+        assert "Required field 'recipient_name' is empty" in report['errors']
+        assert "Required field 'recipient_tin' not in results" in report['errors']
+        assert report['warnings'] == [
+            "Field 'payer_tin' value '94-345' doesn't match pattern '^\\d{2}-?\\d{7}$'"
+        ]
+        assert report['fields_extracted'] == 3
+
+    def test_validate_extraction_checks_every_row(self, extractor):
+        """Test that batch results are validated row by row, skipping falsy values."""
+        results = pd.DataFrame({
+            'payer_name': ['ABC Consulting', None, 'Other', 'Zero'],
+            'payer_tin': ['94-3456789', '94-345', 'bad', 0],
+            'recipient_name': ['Sarah', 'Sam', 'Ann', 'Bo'],
+            'recipient_tin': ['567-89-0123', '567-89-0124', '567-89-0125', '567-89-0126'],
+            'box_1_nonemployee_compensation': [100.0, 200.0, 300.0, 0.0],
+        })
+
+        report = extractor.validate_extraction(results, '1099-nec')
+
+        assert report['errors'] == ["Required field 'payer_name' is empty in rows [1]"]
+        assert [w.rsplit(' ', 2)[-2:] for w in report['warnings']] == [['(row', '1)'], ['(row', '2)']]
+
+
+class TestDolPatterns:
+    """Tests for the DOL Form 5500 pattern search."""
+
+    @pytest.mark.parametrize('use_hyperscan', [False, True])
+    @pytest.mark.parametrize('pdf_name', ['test_5500.pdf', 'test_5500_sf.pdf'])
+    def test_dol_search_matches_re(self, pdf_name, use_hyperscan):
+        """Test that the shared DOL search returns re.search's groups."""
+        if use_hyperscan:
+            pytest.importorskip('hyperscan')
+        from openextract.extractor import _DOL_SCAN_PATTERNS, _dol_searcher
+
+        pdf_path = Path(__file__).parent / 'sample_pdfs' / pdf_name
+        text = Extractor(backend='pdfplumber')._extract_pdf_text(pdf_path)
+        text += '\nTotal assets \u2019 1,000 2,000 \u2026 5a 12 FIDELITY BOND $500\n'
+
+        with patch('openextract.extractor.HYPERSCAN_AVAILABLE', use_hyperscan):
+            search = _dol_searcher(text, text.lower())
+        for pattern in _DOL_SCAN_PATTERNS:
+            expected = pattern.search(text)
+            found = search(pattern)
+            assert (found and found.groups()) == (expected and expected.groups()), pattern.pattern
+
+    @pytest.mark.parametrize('text', [
+        'Name of plan\n  ACME 401(K) PLAN  (PN) 001',
+        'Form 5500\nname of plan 1a\nACME PLAN\n(pn)',
+        'Name of plan ACME (PN)\nName of plan\nOTHER PLAN (PN)',
+        'Name of plan\n' + 'no marker here\n' * 50,
+        'no label (PN)',
+    ])
+    def test_plan_name_search_matches_regex(self, text):
+        """Test that the guarded plan-name search agrees with the plain regex."""
+        from openextract.extractor import _RE_PLAN_NAME, _search_plan_name
+
+        found = _search_plan_name(text)
+        expected = _RE_PLAN_NAME.search(text)
+        assert (found and found.group(1)) == (expected and expected.group(1))
+
+    @pytest.mark.parametrize('raw, expected', [
+        ('1234567738', '738'),
+        ('-123456042', '42'),
+        ('1234567', '7'),
+        ('123456', '123456'),
+        ('1234567a', '1234567a'),
+        ('738', '738'),
+    ])
+    def test_embedded_participant_count(self, raw, expected):
+        """Test that placeholder prefixes are stripped from participant counts."""
+        from openextract.extractor import extract_dol_embedded_value
+
+        assert extract_dol_embedded_value(raw, 'participant') == expected
+
+    def test_case_folding_characters_use_re(self):
+        """Test that text with characters re case-folds to ASCII skips Hyperscan."""
+        from openextract.extractor import _hyperscan_text
+
+        assert _hyperscan_text('Total assets 1 2 \u2019') is not None
+        assert _hyperscan_text('\u212a 5a 12') is None
+        assert _hyperscan_text('5a\x1c12') is None
+
+
+class TestParallelBatch:
+    """Tests for the process-pool path of Extractor.extract_batch."""
+
+    def test_extract_batch_matches_serial(self):
+        """Test that parallel results match serial extraction, in input order."""
+        pdf_dir = Path(__file__).parent / 'sample_pdfs'
+        pdf_paths = [pdf_dir / 'test_5500_sf.pdf', pdf_dir / 'test_5500.pdf']
+
+        extractor = Extractor()
+        results = extractor.extract_batch(pdf_paths, template='form-5500-sf', workers=2)
+
+        expected = pd.concat([
+            extractor.extract(pdf_path, template='form-5500-sf').assign(_source_file=str(pdf_path))
+            for pdf_path in pdf_paths
+        ], ignore_index=True)
+        pd.testing.assert_frame_equal(results, expected)
+
+    def test_method_workers_match_serial(self, capsys):
+        """Test Extractor.extract_batch with workers, including a failing path."""
+        pdf_dir = Path(__file__).parent / 'sample_pdfs'
+        pdf_paths = [pdf_dir / 'test_5500_sf.pdf', pdf_dir / 'missing.pdf', pdf_dir / 'test_5500.pdf']
+
+        extractor = Extractor()
+        parallel = extractor.extract_batch(pdf_paths, template='form-5500-sf', workers=2)
+        serial = extractor.extract_batch(pdf_paths, template='form-5500-sf')
+
+        pd.testing.assert_frame_equal(parallel, serial)
+        assert capsys.readouterr().out.count('Error processing') == 2
+
+    def test_method_batch_rows_match_extract(self):
+        """Test that batch rows equal single extractions, tagged with their source."""
+        pdf_path = Path(__file__).parent / 'sample_pdfs' / 'test_5500_sf.pdf'
+        extractor = Extractor()
+
+        batch = extractor.extract_batch([pdf_path, pdf_path], template='form-5500')
+        single = extractor.extract(pdf_path, template='form-5500')
+
+        assert len(batch) == 2 * len(single)
+        assert list(batch.columns) == list(single.columns) + ['_source_file']
+        assert (batch['_source_file'] == str(pdf_path)).all()
+
+    def test_extract_batch_empty(self):
+        """Test that an empty batch does not start a pool."""
+        with patch('openextract.extractor.ProcessPoolExecutor') as pool:
+            assert Extractor().extract_batch([], template='form-5500', workers=4).empty
+        pool.assert_not_called()
+
+
+class TestCommandLine:
+    """Tests for the python -m openextract entry point."""
+
+    def test_main_writes_csv_per_pdf(self, tmp_path, capsys):
+        """Test that each PDF produces a CSV and failures set the exit code."""
+        from openextract.__main__ import main
+
+        pdf_path = Path(__file__).parent / 'sample_pdfs' / 'test_5500_sf.pdf'
+        exit_code = main([
+            str(pdf_path), str(tmp_path / 'missing.pdf'),
+            '-t', 'form-5500-sf', '-o', str(tmp_path / 'out'), '-j', '2',
+        ])
+
+        assert exit_code == 1
+        assert (tmp_path / 'out' / 'test_5500_sf.csv').exists()
+        assert 'missing.pdf' in capsys.readouterr().err
+
+    def test_main_keeps_outputs_with_same_name(self, tmp_path, capsys):
+        """Test that PDFs with the same file name get separate CSVs."""
+        from openextract.__main__ import main
+
+        sample = (Path(__file__).parent / 'sample_pdfs' / 'test_5500_sf.pdf').read_bytes()
+        paths = []
+        for folder in ('a', 'b'):
+            (tmp_path / folder).mkdir()
+            paths.append(tmp_path / folder / 'x.pdf')
+            paths[-1].write_bytes(sample)
+
+        exit_code = main([*map(str, paths), '-t', 'form-5500-sf', '-o', str(tmp_path / 'out'), '-j', '2'])
+
+        assert exit_code == 0
+        assert sorted(p.name for p in (tmp_path / 'out').iterdir()) == ['x-2.csv', 'x.csv']
+        assert 'same name' in capsys.readouterr().err
+
 
 class TestExtractionWithMockPDF:
     """Tests for extraction with mocked PDF content."""
 
-    @pytest.fixture
-    def extractor(self):
-        """Create an extractor instance."""
-        templates_dir = Path(__file__).parent.parent / 'templates'
-        return Extractor(templates_dir)
-
     @pytest.fixture
     def form_5500_text(self):
         """Sample text content from a Form 5500."""
@@ -302,6 +705,18 @@ class TestExtractionWithMockPDF:
         assert get_value('total_plan_assets_eoy') == '$750,000'
         assert get_value('total_contributions') == '$140,000'
 
+    def test_extract_form_5500_unreadable_pdf_pdfplumber(self, form_5500_text, tmp_path):
+        """Test that a PDF pdfplumber cannot open still falls back to the text pass."""
+        extractor = Extractor(backend='pdfplumber')
+        pdf_path = tmp_path / 'form5500.pdf'
+        pdf_path.write_bytes(b'%PDF-1.4')
+
+        with patch.object(extractor, '_extract_pdf_text', return_value=form_5500_text):
+            results = extractor.extract(str(pdf_path), template='form-5500')
+
+        ein = results.loc[results['field_name'] == 'ein', 'value'].iloc[0]
+        assert ein == '12-3456789'
+
     def test_validate_extraction(self, extractor, form_5500_text, tmp_path):
         """Test extraction validation."""
         pdf_path = tmp_path / 'form5500.pdf'
@@ -328,12 +743,6 @@ class TestExtractionWithMockPDF:
 class TestExtractionRegex:
     """Tests for regex extraction patterns."""
 
-    @pytest.fixture
-    def extractor(self):
-        """Create an extractor instance."""
-        templates_dir = Path(__file__).parent.parent / 'templates'
-        return Extractor(templates_dir)
-
     def test_ein_extraction_formats(self, extractor):
         """Test EIN extraction with various formats."""
         test_cases = [
@@ -351,6 +760,50 @@ class TestExtractionRegex:
             result = extract_first_match(text, ein_field['regex_pattern'])
             assert result is not None, f"Failed to extract EIN from: {text}"
 
+    @pytest.mark.parametrize('sample_name', ['sample_form_5500.txt', 'sample_1099_nec.txt'])
+    def test_field_scan_matches_re(self, extractor, sample_name):
+        """Test that the Hyperscan pre-pass does not change extracted fields."""
+        pytest.importorskip('hyperscan')
+        text = (Path(__file__).parent / 'sample_data' / 'inputs' / sample_name).read_text()
+
+        from openextract.extractor import _field_hyperscan_db
+
+        for template_id in ('form-5500', '1099-nec'):
+            template = extractor.loader.get_compiled_template(template_id)
+            db, ids = _field_hyperscan_db(tuple(
+                pattern for field in template['fields'] for pattern in field.get('_compiled_patterns') or ()
+            ))
+            assert db is not None and ids, f"No Hyperscan database for {template_id}"
+            with patch('openextract.extractor.HYPERSCAN_AVAILABLE', False):
+                expected = extractor._extract_fields(text, template)
+            assert extractor._extract_fields(text, template) == expected
+
+    @pytest.mark.parametrize('text', [
+        'Plan Name: Acme Corp 401(k) Plan\nEIN: 12-3456789',
+        'plan name =   Acme   \n\n',
+        'Plan Name:\n\nAcme Plan   ',
+        'Plan Name:   \nSponsor: X\nplan name Second Plan ' + 'x' * 80,
+        'Plan Name',
+        'PLAN NAME\nplan name: Acme \u017fponsor plan',
+        'Sponsor\u0130: Acme',
+    ])
+    def test_keyword_proximity_window(self, extractor, text):
+        """Test that the sliced window matches the full greedy capture."""
+        from openextract.extractor import _keyword_haystack
+
+        field_def = {'keywords': ['Plan Name', 'Sponsor'], 'max_distance': 50}
+
+        expected = None
+        for keyword in field_def['keywords']:
+            match = re.search(rf'{re.escape(keyword)}\s*[:=]?\s*(\S+(?:\s+\S+)*)', text, re.IGNORECASE)
+            if match:
+                expected = clean_text(match.group(1)[:50].split('\n')[0])
+                break
+        assert extractor._extract_with_keyword_proximity(text, field_def) == expected
+        assert extractor._extract_with_keyword_proximity(
+            text, field_def, _keyword_haystack(text)
+        ) == expected
+
     def test_currency_extraction_formats(self, extractor):
         """Test currency extraction with various formats."""
         test_cases = [
@@ -4,8 +4,11 @@ Tests for template validation and loading.
 
 import json
 import os
+import re
 import sys
+from functools import lru_cache
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -18,12 +21,6 @@ from openextract.template_loader import TemplateLoader
 class TestTemplateLoader:
     """Tests for the TemplateLoader class."""
 
-    @pytest.fixture
-    def loader(self):
-        """Create a template loader instance."""
-        templates_dir = Path(__file__).parent.parent / 'templates'
-        return TemplateLoader(templates_dir)
-
     def test_loader_initialization(self, loader):
         """Test that loader initializes and finds templates."""
         assert loader.template_count > 0, "Should find at least one template"
@@ -40,6 +37,10 @@ class TestTemplateLoader:
             assert 'description' in t
             assert 'category' in t
 
+        # Each call returns fresh dicts over the cached listing
+        templates[0]['id'] = 'changed'
+        assert loader.list_templates()[0]['id'] != 'changed'
+
     def test_get_template(self, loader):
         """Test getting a specific template."""
         template = loader.get_template('form-5500')
@@ -62,19 +63,195 @@ class TestTemplateLoader:
         results = loader.search_templates('5500')
         assert len(results) > 0, "Should find templates with '5500'"
 
+    def test_search_templates_matches_tags(self, loader):
+        """Test that search is case-insensitive and covers tags."""
+        results = loader.search_templates('ACCOUNTS-PAYABLE')
+        assert [t['id'] for t in results] == ['generic-invoice']
+
     def test_templates_by_category(self, loader):
         """Test getting templates by category."""
         templates = loader.get_templates_by_category('401k')
         assert len(templates) > 0, "Should find 401k templates"
+        assert loader.get_templates_by_category('401K') == templates
+
+    def test_templates_by_type(self, loader):
+        """Test getting templates by document type, case-insensitively."""
+        invoices = loader.get_templates_by_type('INVOICE')
+        assert [t['template_id'] for t in invoices] == ['generic-invoice']
+        assert loader.get_templates_by_type('no-such-type') == []
+
+    def test_field_patterns_precompiled(self, loader):
+        """Test that regex fields carry compiled patterns for extraction."""
+        template = loader.get_compiled_template('form-5500')
+        ein_field = next(f for f in template['fields'] if f['field_name'] == 'ein')
+        assert ein_field['_compiled_patterns']
+        assert ein_field['_compiled_patterns'][0].pattern.endswith(ein_field['regex_pattern'])
+
+    def test_templates_stay_plain_json(self, loader):
+        """Test that get_template hands out JSON data, apart from the loader's path keys."""
+        loader.get_compiled_template('form-5500')
+        template = loader.get_template('form-5500')
+        with open(template['_file_path'], 'rb') as f:
+            on_disk = json.load(f)
+        assert json.loads(json.dumps(template)) == dict(
+            on_disk, _category=template['_category'], _file_path=template['_file_path']
+        )
+
+    def test_template_changes_stay_in_one_loader(self, loader):
+        """Test that editing a template from one loader leaves other loaders alone."""
+        other = TemplateLoader(loader.templates_dir)
+        other.get_template('form-5500')['fields'][0]['regex_pattern'] = 'changed'
+        assert loader.get_template('form-5500')['fields'][0]['regex_pattern'] != 'changed'
+
+    def test_field_patterns_compiled_on_first_use(self, tmp_path):
+        """Test that loading defers pattern compilation until a template is fetched."""
+        template_file = tmp_path / 'custom' / 'lazy-template.json'
+        template_file.parent.mkdir()
+        template_file.write_text(json.dumps({
+            'template_id': 'lazy-template',
+            'fields': [{'field_name': 'total', 'regex_pattern': r'Total:\s*(\d+)'}],
+        }))
+
+        loader = TemplateLoader(tmp_path)
+        assert 'lazy-template' not in loader._compiled
+        field = loader.get_compiled_template('lazy-template')['fields'][0]
+        assert field['_compiled_patterns'][0].search('Total: 42').group(1) == '42'
+        assert loader.get_compiled_template('lazy-template') is loader.get_compiled_template('lazy-template')
+
+    def test_re2_falls_back_for_lookarounds(self):
+        """Test that RE2-unsupported patterns are still compiled with re."""
+        pytest.importorskip('re2')
+        from openextract.template_loader import compile_field_patterns
+
+        patterns = compile_field_patterns({
+            'regex_pattern': r'Total:\s*(\d+)',
+            'fallback_patterns': [r'(?<=Sum )(\d+)'],
+        })
+        assert [p.search('Total: 42').group(1) for p in patterns[:1]] == ['42']
+        assert patterns[1].search('Sum 7').group(1) == '7'
+
+    def test_leading_lazy_dots_warn(self):
+        """Test that a leading .*? warns and the pattern is compiled as written."""
+        from openextract.template_loader import compile_field_patterns
+
+        original = r'.*?x|Total:\s*(\d+)'
+        with pytest.warns(UserWarning, match='starts with a lazy'):
+            [pattern] = compile_field_patterns({'regex_pattern': original})
+        assert pattern.pattern.endswith(original)
+
+    @pytest.mark.parametrize('pattern, warns', [
+        (r'Name:\s*(\S+(?:\s+\S+)*)', True),
+        (r'(\w{2,})*', True),
+        (r'(?:\s+\S+){2}', False),
+        (r'\(\d+\)*', False),
+        (r'([+*])+', False),
+        (r'(?:ab)+', False),
+    ])
+    def test_nested_quantifiers_warn(self, pattern, warns, recwarn):
+        """Test that patterns prone to heavy backtracking warn at compile time."""
+        from openextract.template_loader import compile_field_patterns
+
+        compile_field_patterns({'regex_pattern': pattern})
+        assert any('nested quantifiers' in str(w.message) for w in recwarn) == warns
+
+    def test_shipped_patterns_do_not_warn(self, loader, recwarn):
+        """Test that none of the bundled templates trips the pattern lint."""
+        from openextract.template_loader import compile_field_patterns
+
+        for info in loader.list_templates():
+            for field in loader.get_template(info['id'])['fields']:
+                compile_field_patterns(field)
+        assert not [w for w in recwarn if 'Template pattern' in str(w.message)]
+
+    def test_validation_patterns_precompiled(self, loader):
+        """Test that validation patterns are compiled once per template."""
+        template = loader.get_compiled_template('1099-nec')
+        payer_tin = next(f for f in template['fields'] if f['field_name'] == 'payer_tin')
+        assert payer_tin['_validation_re'].pattern == payer_tin['validation']
+        assert payer_tin['_validation_re'].match('94-3456789')
+
+    def test_date_fields_precomputed(self, loader):
+        """Test that date-typed field names are collected once per template."""
+        template = loader.get_compiled_template('form-5500')
+        expected = {f['field_name'] for f in template['fields'] if f.get('data_type') == 'date'}
+        assert template['_date_fields'] == expected
+
+    def test_keyword_patterns_precompiled(self, tmp_path):
+        """Test that keyword_proximity fields get compiled keyword patterns."""
+        template_file = tmp_path / 'custom' / 'kw-template.json'
+        template_file.parent.mkdir()
+        template_file.write_text(json.dumps({
+            'template_id': 'kw-template',
+            'fields': [{
+                'field_name': 'plan_name',
+                'extraction_method': 'keyword_proximity',
+                'keywords': ['Plan Name', 'Name (a.b)'],
+            }],
+        }))
+
+        field = TemplateLoader(tmp_path).get_compiled_template('kw-template')['fields'][0]
+        patterns = field['_keyword_patterns']
+        assert patterns[0].search('PLAN NAME: Acme 401(k)').end() == len('PLAN NAME: ')
+        assert patterns[1].search('name (a.b) = x').end() == len('name (a.b) = ')
+        assert patterns[1].search('name (aXb) = x') is None
+        assert patterns[0].search('Plan name   \n') is None
+
+    def test_json_parsers_agree(self, loader):
+        """Test that orjson, when installed, parses templates like the json module."""
+        pytest.importorskip('orjson')
+        from openextract import template_loader
+
+        path = loader.get_template('form-5500')['_file_path']
+        parse = template_loader._parse_template_file.__wrapped__
+        with_orjson = parse(path, 0)
+        with patch.object(template_loader, 'ORJSON_AVAILABLE', False):
+            with_json = parse(path, 0)
+        assert with_orjson['template_id'] == 'form-5500'
+        assert with_orjson['output_format'] == with_json['output_format']
+        assert [f['field_name'] for f in with_orjson['fields']] == [f['field_name'] for f in with_json['fields']]
+
+    def test_reload_picks_up_edited_template(self, tmp_path):
+        """Test that the parse cache is invalidated when a file changes."""
+        template_file = tmp_path / 'custom' / 'my-template.json'
+        template_file.parent.mkdir()
+        template = {'template_id': 'my-template', 'template_name': 'Before', 'fields': []}
+        template_file.write_text(json.dumps(template))
+
+        loader = TemplateLoader(tmp_path)
+        assert loader.get_template('my-template')['template_name'] == 'Before'
+
+        template['template_name'] = 'After'
+        template_file.write_text(json.dumps(template))
+        stat = template_file.stat()
+        os.utime(template_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        loader.reload()
+        assert loader.get_template('my-template')['template_name'] == 'After'
+
+
+REQUIRED_TEMPLATE_KEYS = (
+    'template_id', 'template_name', 'description',
+    'document_type', 'version', 'fields', 'output_format'
+)
+REQUIRED_FIELD_KEYS = (
+    'field_name', 'display_name', 'data_type',
+    'required', 'extraction_method'
+)
+VALID_DATA_TYPES = (
+    'string', 'integer', 'currency', 'date',
+    'boolean', 'decimal', 'percentage'
+)
+VALID_EXTRACTION_METHODS = ('regex', 'coordinates', 'table', 'keyword_proximity')
+
+
+@lru_cache(maxsize=None)
+def _load_template(template_file):
+    """Parse a shipped template once, however many checks run against it."""
+    return json.loads(template_file.read_bytes())
 
 
 class TestTemplateValidation:
-    """Tests for template JSON validation."""
-
-    @pytest.fixture
-    def templates_dir(self):
-        """Get templates directory."""
-        return Path(__file__).parent.parent / 'templates'
+    """Tests for template JSON validation, run once per shipped template."""
 
     @pytest.fixture
     def schema(self, templates_dir):
@@ -83,170 +260,108 @@ class TestTemplateValidation:
         with open(schema_path, 'r') as f:
             return json.load(f)
 
-    def get_all_template_files(self, templates_dir):
-        """Get all template JSON files."""
-        return [
-            f for f in templates_dir.rglob('*.json')
-            if not f.name.startswith('_')
-        ]
-
-    def test_all_templates_valid_json(self, templates_dir):
-        """Test that all template files are valid JSON."""
-        for template_file in self.get_all_template_files(templates_dir):
-            try:
-                with open(template_file, 'r') as f:
-                    json.load(f)
-            except json.JSONDecodeError as e:
-                pytest.fail(f"Invalid JSON in {template_file}: {e}")
-
-    def test_all_templates_have_required_fields(self, templates_dir):
-        """Test that all templates have required fields."""
-        required_fields = [
-            'template_id', 'template_name', 'description',
-            'document_type', 'version', 'fields', 'output_format'
-        ]
+    @pytest.fixture
+    def template(self, template_file):
+        """The parsed JSON of template_file."""
+        return _load_template(template_file)
 
-        for template_file in self.get_all_template_files(templates_dir):
+    def test_all_templates_valid_json(self, template_file):
+        """Test that the template file is valid JSON."""
+        try:
             with open(template_file, 'r') as f:
-                template = json.load(f)
+                json.load(f)
+        except json.JSONDecodeError as e:
+            pytest.fail(f"Invalid JSON in {template_file}: {e}")
 
-            for field in required_fields:
-                assert field in template, \
-                    f"Missing '{field}' in {template_file}"
+    def test_all_templates_have_required_fields(self, template_file, template):
+        """Test that the template has required fields."""
+        for field in REQUIRED_TEMPLATE_KEYS:
+            assert field in template, \
+                f"Missing '{field}' in {template_file}"
 
-    def test_all_templates_have_valid_fields(self, templates_dir):
+    def test_all_templates_have_valid_fields(self, template_file, template):
         """Test that all template fields have required properties."""
-        required_field_props = [
-            'field_name', 'display_name', 'data_type',
-            'required', 'extraction_method'
-        ]
-
-        for template_file in self.get_all_template_files(templates_dir):
-            with open(template_file, 'r') as f:
-                template = json.load(f)
-
-            for i, field in enumerate(template.get('fields', [])):
-                for prop in required_field_props:
-                    assert prop in field, \
-                        f"Missing '{prop}' in field {i} of {template_file}"
+        for i, field in enumerate(template.get('fields', [])):
+            for prop in REQUIRED_FIELD_KEYS:
+                assert prop in field, \
+                    f"Missing '{prop}' in field {i} of {template_file}"
 
-    def test_template_ids_are_unique(self, templates_dir):
+    def test_template_ids_are_unique(self, template_files):
         """Test that all template IDs are unique."""
-        ids = []
-        for template_file in self.get_all_template_files(templates_dir):
-            with open(template_file, 'r') as f:
-                template = json.load(f)
-            template_id = template.get('template_id')
+        ids = set()
+        for template_file in template_files:
+            template_id = _load_template(template_file).get('template_id')
             assert template_id not in ids, \
                 f"Duplicate template_id: {template_id}"
-            ids.append(template_id)
-
-    def test_template_ids_format(self, templates_dir):
-        """Test that template IDs follow naming convention."""
-        for template_file in self.get_all_template_files(templates_dir):
-            with open(template_file, 'r') as f:
-                template = json.load(f)
+            ids.add(template_id)
 
-            template_id = template.get('template_id', '')
-            assert template_id == template_id.lower(), \
-                f"Template ID should be lowercase: {template_id}"
-            assert ' ' not in template_id, \
-                f"Template ID should not contain spaces: {template_id}"
+    def test_template_ids_format(self, template):
+        """Test that the template ID follows naming convention."""
+        template_id = template.get('template_id', '')
+        assert template_id == template_id.lower(), \
+            f"Template ID should be lowercase: {template_id}"
+        assert ' ' not in template_id, \
+            f"Template ID should not contain spaces: {template_id}"
 
-    def test_field_names_format(self, templates_dir):
+    def test_field_names_format(self, template_file, template):
         """Test that field names follow snake_case convention."""
-        for template_file in self.get_all_template_files(templates_dir):
-            with open(template_file, 'r') as f:
-                template = json.load(f)
-
-            for field in template.get('fields', []):
-                field_name = field.get('field_name', '')
-                assert field_name == field_name.lower(), \
-                    f"Field name should be lowercase in {template_file}: {field_name}"
-                assert ' ' not in field_name, \
-                    f"Field name should not contain spaces in {template_file}: {field_name}"
-
-    def test_valid_data_types(self, templates_dir):
+        for field in template.get('fields', []):
+            field_name = field.get('field_name', '')
+            assert field_name == field_name.lower(), \
+                f"Field name should be lowercase in {template_file}: {field_name}"
+            assert ' ' not in field_name, \
+                f"Field name should not contain spaces in {template_file}: {field_name}"
+
+    def test_valid_data_types(self, template_file, template):
         """Test that all data types are valid."""
-        valid_types = [
-            'string', 'integer', 'currency', 'date',
-            'boolean', 'decimal', 'percentage'
-        ]
+        for field in template.get('fields', []):
+            data_type = field.get('data_type')
+            assert data_type in VALID_DATA_TYPES, \
+                f"Invalid data_type '{data_type}' in {template_file}"
 
-        for template_file in self.get_all_template_files(templates_dir):
-            with open(template_file, 'r') as f:
-                template = json.load(f)
-
-            for field in template.get('fields', []):
-                data_type = field.get('data_type')
-                assert data_type in valid_types, \
-                    f"Invalid data_type '{data_type}' in {template_file}"
-
-    def test_valid_extraction_methods(self, templates_dir):
+    def test_valid_extraction_methods(self, template_file, template):
         """Test that all extraction methods are valid."""
-        valid_methods = ['regex', 'coordinates', 'table', 'keyword_proximity']
+        for field in template.get('fields', []):
+            method = field.get('extraction_method')
+            assert method in VALID_EXTRACTION_METHODS, \
+                f"Invalid extraction_method '{method}' in {template_file}"
 
-        for template_file in self.get_all_template_files(templates_dir):
-            with open(template_file, 'r') as f:
-                template = json.load(f)
-
-            for field in template.get('fields', []):
-                method = field.get('extraction_method')
-                assert method in valid_methods, \
-                    f"Invalid extraction_method '{method}' in {template_file}"
-
-    def test_regex_patterns_compile(self, templates_dir):
+    def test_regex_patterns_compile(self, template_file, template):
         """Test that all regex patterns are valid."""
-        import re
-
-        for template_file in self.get_all_template_files(templates_dir):
-            with open(template_file, 'r') as f:
-                template = json.load(f)
-
-            for field in template.get('fields', []):
-                pattern = field.get('regex_pattern')
-                if pattern:
-                    try:
-                        re.compile(pattern)
-                    except re.error as e:
-                        pytest.fail(
-                            f"Invalid regex in {template_file}, "
-                            f"field '{field.get('field_name')}': {e}"
-                        )
-
-                # Also check fallback patterns
-                for fb_pattern in field.get('fallback_patterns', []):
-                    try:
-                        re.compile(fb_pattern)
-                    except re.error as e:
-                        pytest.fail(
-                            f"Invalid fallback regex in {template_file}, "
-                            f"field '{field.get('field_name')}': {e}"
-                        )
-
-    def test_csv_headers_match_fields(self, templates_dir):
+        for field in template.get('fields', []):
+            pattern = field.get('regex_pattern')
+            if pattern:
+                try:
+                    re.compile(pattern)
+                except re.error as e:
+                    pytest.fail(
+                        f"Invalid regex in {template_file}, "
+                        f"field '{field.get('field_name')}': {e}"
+                    )
+
+            # Also check fallback patterns
+            for fb_pattern in field.get('fallback_patterns', []):
+                try:
+                    re.compile(fb_pattern)
+                except re.error as e:
+                    pytest.fail(
+                        f"Invalid fallback regex in {template_file}, "
+                        f"field '{field.get('field_name')}': {e}"
+                    )
+
+    def test_csv_headers_match_fields(self, template_file, template):
         """Test that CSV headers reference valid field names."""
-        for template_file in self.get_all_template_files(templates_dir):
-            with open(template_file, 'r') as f:
-                template = json.load(f)
-
-            field_names = {f.get('field_name') for f in template.get('fields', [])}
-            csv_headers = template.get('output_format', {}).get('csv_headers', [])
+        field_names = {f.get('field_name') for f in template.get('fields', [])}
+        csv_headers = template.get('output_format', {}).get('csv_headers', [])
 
-            for header in csv_headers:
-                assert header in field_names, \
-                    f"CSV header '{header}' not in fields for {template_file}"
+        for header in csv_headers:
+            assert header in field_names, \
+                f"CSV header '{header}' not in fields for {template_file}"
 
 
 class TestPriorityTemplates:
     """Specific tests for priority Form 5500 templates."""
 
-    @pytest.fixture
-    def loader(self):
-        """Create a template loader instance."""
-        templates_dir = Path(__file__).parent.parent / 'templates'
-        return TemplateLoader(templates_dir)
-
     def test_form_5500_exists(self, loader):
         """Test that Form 5500 template exists."""
         template = loader.get_template('form-5500')